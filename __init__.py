@@ -1,26 +1,53 @@
 from core.agent_base import AgentBase
 from evaluator.criteria import validate_and_score
 from evaluator.llm_feedback import LLMFeedbackAgent
-from datetime import datetime
+from config import get_settings
+import functools
+import json
+from time import time_ns
+
+# Shared across Evaluator instances — the agent is stateless and setup is not free
+_LLM_AGENT = LLMFeedbackAgent()
+
+@functools.lru_cache(maxsize=1024)
+def _cached_feedback(spec_key, spec_score):
+    """Memoized feedback for identical (spec, score) pairs"""
+    spec = json.loads(spec_key)
+    return _LLM_AGENT.generate_comprehensive_feedback(spec, {"spec_score": spec_score})
 
 class Evaluator(AgentBase):
     def __init__(self):
-        self.llm_agent = LLMFeedbackAgent()
-    
+        self.llm_agent = _LLM_AGENT
+
     def run(self, input):
         spec = input.get("spec", {})
-        
+
         # Use existing evaluation system
         evaluation = validate_and_score(spec)
-        
-        # Add LLM feedback
-        feedback = self.llm_agent.generate_comprehensive_feedback(spec, evaluation)
-        
+
+        # LLM feedback is the expensive step — skip it for invalid specs and
+        # when disabled by configuration
+        if not evaluation["valid"]:
+            feedback = {
+                "summary": "Spec failed schema validation.",
+                "improvement_suggestions": [
+                    "Fix validation errors: " + str(evaluation["validation_error"])[:200]
+                ]
+            }
+        elif not get_settings().llm_feedback_enabled:
+            feedback = None
+        else:
+            # Cached by canonical spec JSON + score
+            spec_key = json.dumps(spec, sort_keys=True, separators=(",", ":"))
+            feedback = _cached_feedback(spec_key, evaluation["spec_score"])
+
         # Return complete evaluation
         return {
             "spec_score": evaluation["spec_score"],
             "valid": evaluation["valid"],
             "validation_error": evaluation.get("validation_error"),
             "llm_feedback": feedback,
-            "timestamp": datetime.now().isoformat()
-        }
\ No newline at end of file
+            # Epoch nanoseconds: one syscall vs datetime construction + isoformat.
+            # Format to ISO at persistence boundaries if a string is needed.
+            "timestamp": time_ns()
+        }
@@ -1,8 +1,9 @@
-from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Any, Dict, Protocol, runtime_checkable
+
+@runtime_checkable
+class AgentBase(Protocol):
+    """Structural agent interface — no ABCMeta cost at subclass instantiation"""
 
-class AgentBase(ABC):
-    @abstractmethod
     def run(self, input: Dict[str, Any]) -> Dict[str, Any]:
         """Run agent with input dict and return output dict"""
-        ...
\ No newline at end of file
+        ...
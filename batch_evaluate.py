@@ -1,37 +1,162 @@
-import json
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+import aiohttp
+import orjson
 import requests
-import pathlib
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Pooled session for the sync path: one TCP connection reused across all posts
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=20, pool_maxsize=20,
+                                      max_retries=Retry(total=3, backoff_factor=0.2)))
+_SESSION.headers["Connection"] = "keep-alive"
+
+def _sample_files(samples_dir="samples"):
+    """List (name, path) for sample JSON files with a single scandir pass"""
+    with os.scandir(samples_dir) as it:
+        entries = [(e.name, e.path) for e in it if e.is_file() and e.name.endswith(".json")]
+    entries.sort()
+    return entries
+
+def _read_spec(path):
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+async def _load_spec(path):
+    """Read and parse a sample file off the event loop thread"""
+    return await asyncio.to_thread(_read_spec, path)
+
+async def _post_one(session, sem, name, path, base_url):
+    """Post a single sample spec to /evaluate, bounded by the semaphore"""
+    spec = await _load_spec(path)
+
+    payload = {
+        "prompt": f"Sample from {name}",
+        "spec": spec
+    }
+
+    async with sem:
+        async with session.post(f"{base_url}/evaluate", json=payload) as response:
+            response.raise_for_status()
+            return await response.json()
+
+async def batch_evaluate_async():
+    """Batch evaluate all samples concurrently and store in DB"""
+    base_url = "http://127.0.0.1:8000"
+
+    samples = _sample_files()
+
+    # Keep-alive connector reuses TCP connections; semaphore bounds in-flight requests
+    connector = aiohttp.TCPConnector(limit=20, keepalive_timeout=30)
+    sem = asyncio.Semaphore(16)
+
+    async with aiohttp.ClientSession(connector=connector) as session:
+        results = await asyncio.gather(
+            *[_post_one(session, sem, name, path, base_url) for name, path in samples],
+            return_exceptions=True
+        )
+
+    for (name, _), result in zip(samples, results):
+        print(f"Processing {name}...")
+
+        if isinstance(result, Exception):
+            print(f"  Failed: {result}")
+            continue
+
+        print(f"  Report ID: {result['report_id']}")
+        print(f"  Score: {result['score']}/10")
 
-def batch_evaluate():
-    """Batch evaluate all samples and store in DB"""
-    samples_dir = pathlib.Path("samples")
+def batch_evaluate(chunk_size=32):
+    """Batch evaluate all samples in one request per chunk and store in DB"""
     base_url = "http://127.0.0.1:8000"
-    
-    for json_file in samples_dir.glob("*.json"):
-        print(f"Processing {json_file.name}...")
-        
+
+    samples = _sample_files()
+    payloads = [
+        {"prompt": f"Sample from {name}", "spec": _read_spec(path)}
+        for name, path in samples
+    ]
+
+    # One POST per chunk amortizes HTTP round-trip overhead over many specs;
+    # a failed chunk (server down, timeout) is reported and skipped so the
+    # rest of the run still completes
+    for start in range(0, len(payloads), chunk_size):
+        chunk = samples[start:start + chunk_size]
         try:
-            # Load spec
-            spec = json.loads(json_file.read_text())
-            
-            # Create payload
-            payload = {
-                "prompt": f"Sample from {json_file.name}",
-                "spec": spec
-            }
-            
-            # Post to evaluate endpoint
-            response = requests.post(f"{base_url}/evaluate", json=payload)
-            
-            if response.status_code == 200:
-                result = response.json()
-                print(f"  Report ID: {result['report_id']}")
-                print(f"  Score: {result['score']}/10")
-            else:
-                print(f"  Error: {response.status_code}")
-                
-        except Exception as e:
-            print(f"  Failed: {e}")
+            response = _SESSION.post(
+                f"{base_url}/evaluate/batch",
+                json={"items": payloads[start:start + chunk_size]},
+                timeout=30
+            )
+        except requests.exceptions.RequestException as e:
+            for name, _ in chunk:
+                print(f"Processing {name}...")
+                print(f"  Failed: {e}")
+            continue
+
+        if response.status_code != 200:
+            print(f"  Error: {response.status_code}")
+            continue
+
+        for (name, _), result in zip(chunk, response.json()["results"]):
+            print(f"Processing {name}...")
+            print(f"  Report ID: {result['report_id']}")
+            print(f"  Score: {result['score']}/10")
+
+def _evaluate_one_local(spec):
+    """Worker: evaluate one spec in-process, bypassing HTTP"""
+    from evaluator import Evaluator
+    return Evaluator().run({"spec": spec})
+
+def batch_evaluate_local():
+    """Evaluate all samples in-process across CPUs when /evaluate is CPU-bound"""
+    from config import get_settings
+
+    samples = _sample_files()
+    specs = [_read_spec(path) for _, path in samples]
+
+    if get_settings().batch_processing_enabled:
+        # Validation/feedback work is GIL-bound; processes use all cores
+        with ProcessPoolExecutor(max_workers=min(20, os.cpu_count())) as pool:
+            results = list(pool.map(_evaluate_one_local, specs, chunksize=8))
+    else:
+        results = [_evaluate_one_local(spec) for spec in specs]
+
+    for (name, _), result in zip(samples, results):
+        print(f"Processing {name}...")
+        print(f"  Score: {result['spec_score']}/10")
+
+    return results
+
+def batch_evaluate_reports(report_dir="reports"):
+    """Validate and score all samples in one pass, writing reports concurrently"""
+    from evaluator.criteria import validate_and_score_batch
+    from evaluator.report import generate_reports
+
+    samples = _sample_files()
+    specs = [_read_spec(path) for _, path in samples]
+
+    # One validation + scoring pass over the whole batch instead of N calls
+    evaluations = validate_and_score_batch(specs)
+
+    os.makedirs(report_dir, exist_ok=True)
+
+    # Report writing is disk-bound; submitting every write up front lets the
+    # pool overlap file I/O, and scores print as each report lands on disk
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = {
+            pool.submit(generate_reports, report_dir, name, evaluation): (name, evaluation)
+            for (name, _), evaluation in zip(samples, evaluations)
+        }
+        for future in as_completed(futures):
+            name, evaluation = futures[future]
+            future.result()
+            print(f"Processing {name}...")
+            print(f"  Score: {evaluation['spec_score']}/10")
+
+    return evaluations
 
 if __name__ == "__main__":
-    batch_evaluate()
\ No newline at end of file
+    batch_evaluate()
@@ -0,0 +1,78 @@
+"""
+Response caching for deterministic endpoints
+Agent output is a pure function of the request body, so identical requests
+can be answered from a TTL-bounded LRU cache instead of re-running the agent
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+class ResponseCache:
+    """In-process LRU cache with per-entry TTL and hit/miss counters
+
+    Sync endpoints run on FastAPI's threadpool, so the cache is hit from
+    concurrent worker threads; a lock guards every read-modify-write.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: int = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def stats(self):
+        return {"cache_hits": self.hits, "cache_misses": self.misses, "cache_size": len(self._entries)}
+
+# Shared cache for the agent endpoints
+response_cache = ResponseCache()
+
+def payload_key(payload) -> str:
+    """Canonical hash of a request model, stable across key ordering"""
+    body = json.dumps(payload.model_dump(), sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(body.encode(), digest_size=16).hexdigest()
+
+def cached(cache: ResponseCache, key_fn=payload_key):
+    """Wrap an endpoint so identical request bodies return the cached response"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(payload):
+            key = key_fn(payload)
+            hit = cache.get(key)
+            if hit is not None:
+                return hit
+
+            result = func(payload)
+            cache.set(key, result)
+            return result
+        return wrapper
+    return decorator
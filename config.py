@@ -3,9 +3,10 @@ Production configuration management
 Environment-based settings for different deployment scenarios
 """
 
+import functools
 import os
 from typing import Optional
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import validator
 
 class Settings(BaseSettings):
@@ -58,10 +59,9 @@ class Settings(BaseSettings):
         if isinstance(v, str):
             return [origin.strip() for origin in v.split(",")]
         return v
-    
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+
+    # frozen=True skips per-attribute __setattr__ hooks; settings never change after load
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", frozen=True)
 
 class DevelopmentSettings(Settings):
     """Development environment settings"""
@@ -90,8 +90,9 @@ class TestingSettings(Settings):
     monitoring_enabled: bool = False
     rate_limit_enabled: bool = False
 
+@functools.lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get settings based on environment"""
+    """Get settings based on environment (parsed once per process)"""
     env = os.getenv("ENVIRONMENT", "development").lower()
     
     if env == "production":
@@ -1,7 +1,23 @@
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
 from typing import List, Optional
 import re
 
+import numpy as np
+
+# Compiled once at import; parse_dimensions/score run per spec during batch evaluation
+# One pattern captures width, depth, optional height and optional unit in a single pass
+_DIM_RE = re.compile(
+    r'^\s*(\d+(?:\.\d+)?)\s*[xX×]\s*(\d+(?:\.\d+)?)\s*(?:[xX×]\s*(\d+(?:\.\d+)?)\s*)?([a-zA-Z]+)?\s*$')
+
+_REALISTIC_MATERIALS = frozenset({"steel", "wood", "concrete", "glass", "aluminum",
+                                  "carbon fiber", "brick", "stone", "plastic", "metal"})
+_BUILDING_TYPES = frozenset({"building", "house", "castle", "library", "office"})
+_MECHANICAL_TYPES = frozenset({"gearbox", "drone", "arm", "hand", "car", "engine", "table"})
+_REQUIRED_FIELDS = ("type", "material", "dimensions", "color", "purpose", "extras")
+_REQUIRED_FIELDS_SET = frozenset(_REQUIRED_FIELDS)
+_KNOWN_TYPES_SET = _BUILDING_TYPES | _MECHANICAL_TYPES
+_KNOWN_TYPES = np.array(sorted(_KNOWN_TYPES_SET))
+
 class Dimension(BaseModel):
     unit: str
     width: float
@@ -9,6 +25,8 @@ class Dimension(BaseModel):
     height: float
 
 class Spec(BaseModel):
+    model_config = ConfigDict(extra='ignore', str_strip_whitespace=False, populate_by_name=True)
+
     name: Optional[str] = None
     type: str
     material: List[str] = Field(alias='material')
@@ -17,26 +35,40 @@ class Spec(BaseModel):
     purpose: Optional[str] = None
     extras: Optional[str] = None
 
+# Reuses the compiled schema across batch items instead of per-item lookup
+_SPEC_LIST_ADAPTER = TypeAdapter(List[Spec])
+
+def validate_many(specs: List[dict]) -> List[dict]:
+    """Validate a batch of specs in one adapter pass, returning per-item status"""
+    try:
+        _SPEC_LIST_ADAPTER.validate_python(specs)
+        return [{"valid": True, "validation_error": None} for _ in specs]
+    except ValidationError as e:
+        errors_by_item = {}
+        for err in e.errors():
+            idx = err["loc"][0]
+            errors_by_item.setdefault(idx, []).append(dict(err, loc=err["loc"][1:]))
+        return [
+            {"valid": i not in errors_by_item, "validation_error": errors_by_item.get(i)}
+            for i in range(len(specs))
+        ]
+
 def parse_dimensions(dim_string: str) -> Optional[Dimension]:
     """Parse dimension string like '4.5x1.8x1.4m' into Dimension model"""
     if not dim_string:
         return None
-    
-    # Extract unit (m, cm, mm, etc.)
-    unit_match = re.search(r'([a-zA-Z]+)$', dim_string)
-    unit = unit_match.group(1) if unit_match else "unknown"
-    
-    # Extract numbers
-    numbers = re.findall(r'(\d+(?:\.\d+)?)', dim_string)
-    
-    if len(numbers) >= 2:
-        width = float(numbers[0])
-        depth = float(numbers[1])
-        height = float(numbers[2]) if len(numbers) >= 3 else 1.0
-        
-        return Dimension(unit=unit, width=width, depth=depth, height=height)
-    
-    return None
+
+    match = _DIM_RE.match(dim_string)
+    if not match:
+        return None
+
+    width, depth, height, unit = match.groups()
+    return Dimension(
+        unit=unit or "unknown",
+        width=float(width),
+        depth=float(depth),
+        height=float(height) if height else 1.0
+    )
 
 def score(spec_data: dict) -> dict:
     """Score spec based on Task 2 criteria"""
@@ -49,40 +81,103 @@ def score(spec_data: dict) -> dict:
         if parsed_dim and parsed_dim.width > 0 and parsed_dim.depth > 0:
             s += 2
     
-    # Material realistic? (+2)
-    realistic_materials = ["steel", "wood", "concrete", "glass", "aluminum", 
-                          "carbon fiber", "brick", "stone", "plastic", "metal"]
-    materials = spec_data.get("material", [])
-    if any(mat.lower() in realistic_materials for mat in materials):
+    # Material realistic? (+2) — C-level set intersection, no generator protocol
+    mats_lc = {mat.lower() for mat in spec_data.get("material", ())}
+    if mats_lc & _REALISTIC_MATERIALS:
         s += 2
-    
+
     # Type matches prompt? (+2)
-    building_types = ["building", "house", "castle", "library", "office"]
-    mechanical_types = ["gearbox", "drone", "arm", "hand", "car", "engine", "table"]
-    spec_type = spec_data.get("type", "").lower()
-    if spec_type in building_types or spec_type in mechanical_types:
+    if spec_data.get("type", "").lower() in _KNOWN_TYPES_SET:
         s += 2
-    
+
     # Format correct JSON? (+4)
-    required_fields = ["type", "material", "dimensions", "color", "purpose", "extras"]
-    if all(field in spec_data for field in required_fields):
+    if spec_data.keys() >= _REQUIRED_FIELDS_SET:
         s += 4
     
     return {"spec_score": min(s, 10)}
 
+def _dimensions_valid(dim_string) -> bool:
+    parsed_dim = parse_dimensions(dim_string)
+    return bool(parsed_dim and parsed_dim.width > 0 and parsed_dim.depth > 0)
+
+def score_many(specs: List[dict]) -> np.ndarray:
+    """Score a whole batch of specs at once, vectorizing the four criteria"""
+    n = len(specs)
+    if n == 0:
+        return np.empty(0, dtype=np.int64)
+
+    dim_ok = np.fromiter(
+        (bool(s.get("dimensions")) and _dimensions_valid(s["dimensions"]) for s in specs),
+        dtype=bool, count=n)
+    mat_ok = np.fromiter(
+        (not _REALISTIC_MATERIALS.isdisjoint(m.lower() for m in s.get("material", []) or []) for s in specs),
+        dtype=bool, count=n)
+    type_ok = np.isin(np.array([s.get("type", "").lower() for s in specs]), _KNOWN_TYPES)
+    fmt_ok = np.fromiter((s.keys() >= _REQUIRED_FIELDS_SET for s in specs), dtype=bool, count=n)
+
+    return np.minimum(2 * dim_ok + 2 * mat_ok + 2 * type_ok + 4 * fmt_ok, 10)
+
+def score_from_model(spec: Spec) -> int:
+    """Score a validated Spec from its attributes (dimension/material/type criteria)"""
+    s = 0
+
+    # Dimensions present and valid? (+2)
+    if spec.dimensions:
+        parsed_dim = parse_dimensions(spec.dimensions)
+        if parsed_dim and parsed_dim.width > 0 and parsed_dim.depth > 0:
+            s += 2
+
+    # Material realistic? (+2)
+    if spec.material and {mat.lower() for mat in spec.material} & _REALISTIC_MATERIALS:
+        s += 2
+
+    # Type matches prompt? (+2)
+    if spec.type.lower() in _KNOWN_TYPES_SET:
+        s += 2
+
+    return s
+
+def validate_and_score_batch(specs: List[dict]) -> List[dict]:
+    """Validate and score a batch of specs with one validation and scoring pass"""
+    statuses = validate_many(specs)
+
+    # Only valid specs reach the vectorized scorer; invalid ones score 0
+    valid_indices = [i for i, status in enumerate(statuses) if status["valid"]]
+    valid_scores = score_many([specs[i] for i in valid_indices])
+
+    scores = [0] * len(specs)
+    for i, spec_score in zip(valid_indices, valid_scores):
+        scores[i] = int(spec_score)
+
+    return [
+        {
+            "valid": status["valid"],
+            "spec_score": spec_score,
+            "validation_error": status["validation_error"],
+        }
+        for status, spec_score in zip(statuses, scores)
+    ]
+
 def validate_and_score(spec_data: dict) -> dict:
     """Validate spec and return score with validation status"""
     try:
-        spec = Spec(**spec_data)
-        score_result = score(spec_data)
-        return {
-            "valid": True,
-            "spec_score": score_result["spec_score"],
-            "validation_error": None
-        }
+        spec = Spec.model_validate(spec_data)
     except ValidationError as e:
+        # errors() is structured and skips the costly message-formatting path
         return {
             "valid": False,
             "spec_score": 0,
-            "validation_error": str(e)
-        }
\ No newline at end of file
+            "validation_error": e.errors()
+        }
+
+    s = score_from_model(spec)
+
+    # Format correct JSON? (+4) — checked on the raw dict, the model fills defaults
+    if spec_data.keys() >= _REQUIRED_FIELDS_SET:
+        s += 4
+
+    return {
+        "valid": True,
+        "spec_score": min(s, 10),
+        "validation_error": None
+    }
\ No newline at end of file
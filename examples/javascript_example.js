@@ -0,0 +1,90 @@
+// JavaScript/TypeScript Frontend Integration
+class PromptToJsonAPI {
+    constructor(baseURL = 'http://localhost:8000') {
+        this.baseURL = baseURL;
+    }
+
+    async generateSpec(prompt) {
+        const response = await fetch(`${this.baseURL}/generate`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ prompt })
+        });
+        
+        if (!response.ok) {
+            throw new Error(`HTTP error! status: ${response.status}`);
+        }
+        
+        return await response.json();
+    }
+
+    async evaluateSpec(prompt, spec) {
+        const response = await fetch(`${this.baseURL}/evaluate`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ prompt, spec })
+        });
+        
+        return await response.json();
+    }
+
+    async iterateSpec(spec, maxIters = 3) {
+        const response = await fetch(`${this.baseURL}/iterate`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ spec, max_iters: maxIters })
+        });
+        
+        return await response.json();
+    }
+
+    async getReport(reportId) {
+        const response = await fetch(`${this.baseURL}/reports/${reportId}`);
+        return await response.json();
+    }
+
+    async logValues(values) {
+        const response = await fetch(`${this.baseURL}/log-values`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify(values)
+        });
+        
+        return await response.json();
+    }
+}
+
+// Usage Example
+const api = new PromptToJsonAPI();
+
+async function processPrompt(userInput) {
+    try {
+        // Generate initial spec
+        const spec = await api.generateSpec(userInput);
+        console.log('Generated spec:', spec);
+        
+        // Evaluate quality
+        const evaluation = await api.evaluateSpec(userInput, spec);
+        console.log('Evaluation:', evaluation);
+        
+        // Improve with RL if score is low
+        if (evaluation.score < 8) {
+            const improved = await api.iterateSpec(spec, 3);
+            console.log('Improved spec:', improved.final_spec);
+            return improved.final_spec;
+        }
+        
+        return spec;
+    } catch (error) {
+        console.error('API Error:', error);
+        throw error;
+    }
+}
@@ -0,0 +1,75 @@
+// React Component Example
+import React, { useState, useCallback } from 'react';
+
+const PromptToJsonGenerator = () => {
+    const [prompt, setPrompt] = useState('');
+    const [spec, setSpec] = useState(null);
+    const [loading, setLoading] = useState(false);
+    const [error, setError] = useState(null);
+
+    const generateSpec = useCallback(async () => {
+        if (!prompt.trim()) return;
+        
+        setLoading(true);
+        setError(null);
+        
+        try {
+            const response = await fetch('http://localhost:8000/generate', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                },
+                body: JSON.stringify({ prompt })
+            });
+            
+            if (!response.ok) {
+                throw new Error(`HTTP error! status: ${response.status}`);
+            }
+            
+            const result = await response.json();
+            setSpec(result);
+        } catch (err) {
+            setError(err.message);
+        } finally {
+            setLoading(false);
+        }
+    }, [prompt]);
+
+    return (
+        <div className="prompt-generator">
+            <h2>Prompt to JSON Generator</h2>
+            
+            <div className="input-section">
+                <textarea
+                    value={prompt}
+                    onChange={(e) => setPrompt(e.target.value)}
+                    placeholder="Enter your design prompt..."
+                    rows={4}
+                    cols={50}
+                />
+                <br />
+                <button 
+                    onClick={generateSpec} 
+                    disabled={loading || !prompt.trim()}
+                >
+                    {loading ? 'Generating...' : 'Generate Specification'}
+                </button>
+            </div>
+
+            {error && (
+                <div className="error">
+                    Error: {error}
+                </div>
+            )}
+
+            {spec && (
+                <div className="result-section">
+                    <h3>Generated Specification:</h3>
+                    <pre>{JSON.stringify(spec, null, 2)}</pre>
+                </div>
+            )}
+        </div>
+    );
+};
+
+export default PromptToJsonGenerator;
@@ -1,87 +1,116 @@
+import re
+from types import MappingProxyType
+
+# One regex classification per fix instead of four substring scans
+_KEYWORD_RE = re.compile(r"\b(dimension|material|purpose|color)s?\b", re.I)
+
 def suggest_fixes(spec, eval_notes, llm_feedback=None):
     """Generate intelligent fixes integrating heuristic and LLM-based suggestions"""
-    fixes = []
-    spec_type = spec.get("type", "unknown").lower()
-    
+    # Hoist dict lookups — each field is checked at most once below
+    dimensions = spec.get("dimensions")
+    material = spec.get("material")
+    purpose = spec.get("purpose")
+
     # Prioritize LLM suggestions if available
     if llm_feedback and llm_feedback.get('improvement_suggestions'):
-        fixes.extend(llm_feedback['improvement_suggestions'][:2])
-    
-    # Add heuristic fixes for missing critical fields
-    if not spec.get("dimensions"):
-        fixes.append(_get_dimension_suggestion(spec_type))
-    
-    if not spec.get("material") or spec.get("material") == ["unknown"]:
-        fixes.append(_get_material_suggestion(spec_type))
-    
-    if not spec.get("purpose") and len(fixes) < 3:
+        fixes = list(llm_feedback['improvement_suggestions'][:2])
+    else:
+        fixes = []
+
+    # Add heuristic fixes for missing critical fields; the lowered type is only
+    # needed when one of them actually fires
+    material_missing = not material or material == ["unknown"]
+    if not dimensions or material_missing:
+        spec_type = (spec.get("type") or "unknown").lower()
+
+        if not dimensions:
+            fixes.append(_get_dimension_suggestion(spec_type))
+
+        if material_missing:
+            fixes.append(_get_material_suggestion(spec_type))
+
+    if not purpose and len(fixes) < 3:
         fixes.append("Add purpose or use case description.")
-    
+
     return fixes[:3]  # Limit to top 3 most important fixes
 
+_DIMENSION_SUGGESTIONS = MappingProxyType({
+    "car": "Add car dimensions (typical: 4.5x1.8x1.4m for sports car)",
+    "building": "Add building dimensions (consider: 20x15x8m for office)",
+    "table": "Add table dimensions (standard: 180x90x75cm dining)",
+    "drone": "Add drone dimensions (typical: 50x50x15cm for quadcopter)"
+})
+
+_MATERIAL_SUGGESTIONS = MappingProxyType({
+    "car": "Add automotive materials (aluminum, steel, carbon fiber)",
+    "building": "Add construction materials (concrete, glass, steel)",
+    "drone": "Add aerospace materials (carbon fiber, aluminum)",
+    "table": "Add furniture materials (wood, metal, glass)"
+})
+
 def _get_dimension_suggestion(spec_type):
     """Get contextual dimension suggestion"""
-    suggestions = {
-        "car": "Add car dimensions (typical: 4.5x1.8x1.4m for sports car)",
-        "building": "Add building dimensions (consider: 20x15x8m for office)",
-        "table": "Add table dimensions (standard: 180x90x75cm dining)",
-        "drone": "Add drone dimensions (typical: 50x50x15cm for quadcopter)"
-    }
-    return suggestions.get(spec_type, "Add dimensions with unit, width, depth, height.")
+    return _DIMENSION_SUGGESTIONS.get(spec_type, "Add dimensions with unit, width, depth, height.")
 
 def _get_material_suggestion(spec_type):
     """Get contextual material suggestion"""
-    suggestions = {
-        "car": "Add automotive materials (aluminum, steel, carbon fiber)",
-        "building": "Add construction materials (concrete, glass, steel)",
-        "drone": "Add aerospace materials (carbon fiber, aluminum)",
-        "table": "Add furniture materials (wood, metal, glass)"
-    }
-    return suggestions.get(spec_type, "List realistic materials for this object type")
+    return _MATERIAL_SUGGESTIONS.get(spec_type, "List realistic materials for this object type")
+
+# Contextually appropriate values per object type, shared by all smart appliers
+# so every call reads the same constants instead of rebuilding dict literals.
+# The proxies only guard the mappings themselves — the material lists stay
+# mutable, so readers copy them before handing them to callers.
+_SMART = MappingProxyType({
+    "car": MappingProxyType({"dimensions": "4.5x1.8x1.4m", "material": ["aluminum", "steel"], "purpose": "transportation", "color": "red"}),
+    "building": MappingProxyType({"dimensions": "20x15x8m", "material": ["concrete", "glass"], "purpose": "commercial use", "color": "gray"}),
+    "drone": MappingProxyType({"dimensions": "50x50x15cm", "material": ["carbon fiber"], "purpose": "surveillance", "color": "black"}),
+    "table": MappingProxyType({"dimensions": "180x90x75cm", "material": ["wood"], "purpose": "dining", "color": "brown"}),
+})
+_SMART_DEFAULT = MappingProxyType({"dimensions": "100x50x30cm", "material": ["steel"], "purpose": "general use", "color": "gray"})
+
+# Keyword (from _KEYWORD_RE) -> spec field it fills
+_APPLIERS = {
+    "dimension": "dimensions",
+    "material": "material",
+    "purpose": "purpose",
+    "color": "color",
+}
 
 def apply_fixes(spec, fixes):
     """Apply suggested fixes with sophisticated logic"""
     improved_spec = dict(spec)
     obj_type = improved_spec.get("type")
-    
-    for fix in fixes:
-        # Smart dimension application
-        if "dimension" in fix.lower() and not improved_spec.get("dimensions"):
-            improved_spec["dimensions"] = _apply_smart_dimensions(obj_type)
-        
-        # Smart material application
-        if "material" in fix.lower() and (not improved_spec.get("material") or improved_spec.get("material") == ["unknown"]):
-            improved_spec["material"] = _apply_smart_materials(obj_type)
-        
-        # Smart purpose application
-        if "purpose" in fix.lower() and not improved_spec.get("purpose"):
-            improved_spec["purpose"] = _apply_smart_purpose(obj_type)
-        
-        # Smart color application
-        if "color" in fix.lower() and not improved_spec.get("color"):
-            improved_spec["color"] = _apply_smart_color(obj_type)
-    
+    smart = _SMART.get(obj_type, _SMART_DEFAULT)
+
+    # One scan over the joined suggestions instead of a search per fix; the
+    # case-insensitive pattern makes explicit lower() calls unnecessary
+    for keyword in set(_KEYWORD_RE.findall(" ".join(fixes))):
+        key = _APPLIERS[keyword.lower()]
+        current = improved_spec.get(key)
+
+        # Only fill fields that are missing (or material left as ["unknown"])
+        if not current or (key == "material" and current == ["unknown"]):
+            value = smart.get(key, _SMART_DEFAULT[key])
+            # Copy list values so callers can't mutate the shared table
+            improved_spec[key] = list(value) if isinstance(value, list) else value
+
     return improved_spec
 
 def _apply_smart_dimensions(obj_type):
     """Apply contextually appropriate dimensions"""
-    dims = {"car": "4.5x1.8x1.4m", "building": "20x15x8m", "table": "180x90x75cm", "drone": "50x50x15cm"}
-    return dims.get(obj_type, "100x50x30cm")
+    return _SMART.get(obj_type, _SMART_DEFAULT)["dimensions"]
 
 def _apply_smart_materials(obj_type):
     """Apply contextually appropriate materials"""
-    materials = {"car": ["aluminum", "steel"], "building": ["concrete", "glass"], "drone": ["carbon fiber"], "table": ["wood"]}
-    return materials.get(obj_type, ["steel"])
+    return list(_SMART.get(obj_type, _SMART_DEFAULT)["material"])
 
 def _apply_smart_purpose(obj_type):
     """Apply contextually appropriate purpose"""
-    purposes = {"car": "transportation", "building": "commercial use", "drone": "surveillance", "table": "dining"}
-    return purposes.get(obj_type, "general use")
+    return _SMART.get(obj_type, _SMART_DEFAULT)["purpose"]
 
 def _apply_smart_color(obj_type):
     """Apply contextually appropriate color"""
-    colors = {"car": "red", "building": "gray", "drone": "black", "table": "brown"}
-    return colors.get(obj_type, "gray")
+    return _SMART.get(obj_type, _SMART_DEFAULT)["color"]
 
 def calculate_reward(score, completeness=None):
     """Calculate enhanced reward with multiple factors"""
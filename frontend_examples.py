@@ -4,17 +4,36 @@ Sample code for integrating with the prompt-to-json-agent API
 """
 
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import functools
 import asyncio
 import aiohttp
+import orjson
+from pathlib import Path
 from typing import Dict, Any, Optional
 
+def _parse_json(response) -> Dict[str, Any]:
+    """Decode a requests response with orjson instead of the stdlib parser"""
+    return orjson.loads(response.content)
+
 class PromptToJsonClient:
     """Python client for prompt-to-json-agent API"""
-    
+
     def __init__(self, base_url: str = "http://localhost:8000"):
         self.base_url = base_url.rstrip("/")
         self.session = requests.Session()
+
+        # Larger pool + retries so sequential helper calls reuse one connection
+        # and transient 5xx responses don't force a full TCP+TLS redial
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.1, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip, deflate, br"})
     
     def generate_spec(self, prompt: str) -> Dict[str, Any]:
         """Generate specification from natural language prompt"""
@@ -23,7 +42,7 @@ class PromptToJsonClient:
             json={"prompt": prompt}
         )
         response.raise_for_status()
-        return response.json()
+        return _parse_json(response)
     
     def evaluate_spec(self, prompt: str, spec: Dict[str, Any]) -> Dict[str, Any]:
         """Evaluate specification quality and get report ID"""
@@ -32,7 +51,7 @@ class PromptToJsonClient:
             json={"prompt": prompt, "spec": spec}
         )
         response.raise_for_status()
-        return response.json()
+        return _parse_json(response)
     
     def iterate_spec(self, spec: Dict[str, Any], max_iters: int = 3) -> Dict[str, Any]:
         """Run RL iterations to improve specification"""
@@ -41,13 +60,22 @@ class PromptToJsonClient:
             json={"spec": spec, "max_iters": max_iters}
         )
         response.raise_for_status()
-        return response.json()
+        return _parse_json(response)
     
+    def run_pipeline(self, prompt: str, score_threshold: int = 8) -> Dict[str, Any]:
+        """Generate, evaluate and improve a spec in a single round-trip"""
+        response = self.session.post(
+            f"{self.base_url}/pipeline",
+            json={"prompt": prompt, "score_threshold": score_threshold}
+        )
+        response.raise_for_status()
+        return _parse_json(response)
+
     def get_report(self, report_id: str) -> Dict[str, Any]:
         """Retrieve evaluation report by ID"""
         response = self.session.get(f"{self.base_url}/reports/{report_id}")
         response.raise_for_status()
-        return response.json()
+        return _parse_json(response)
     
     def log_values(self, **values) -> Dict[str, Any]:
         """Log HIDG values"""
@@ -56,298 +84,130 @@ class PromptToJsonClient:
             json=values
         )
         response.raise_for_status()
-        return response.json()
+        return _parse_json(response)
     
     def health_check(self) -> Dict[str, Any]:
         """Check API health status"""
         response = self.session.get(f"{self.base_url}/health")
         response.raise_for_status()
-        return response.json()
+        return _parse_json(response)
 
-class AsyncPromptToJsonClient:
-    """Async Python client for high-performance applications"""
-    
-    def __init__(self, base_url: str = "http://localhost:8000"):
-        self.base_url = base_url.rstrip("/")
-    
-    async def generate_spec(self, prompt: str) -> Dict[str, Any]:
-        """Async generate specification"""
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.base_url}/generate",
-                json={"prompt": prompt}
-            ) as response:
-                response.raise_for_status()
-                return await response.json()
-    
-    async def batch_generate(self, prompts: list) -> list:
-        """Generate multiple specs concurrently"""
-        async with aiohttp.ClientSession() as session:
-            tasks = []
-            for prompt in prompts:
-                task = session.post(
-                    f"{self.base_url}/generate",
-                    json={"prompt": prompt}
-                )
-                tasks.append(task)
-            
-            responses = await asyncio.gather(*tasks)
-            results = []
-            for response in responses:
-                response.raise_for_status()
-                results.append(await response.json())
-            
-            return results
+# One connection pool per event loop, shared by every async client instance
+# on that loop so warm sockets and the DNS cache survive individual client
+# lifecycles. Connectors are loop-bound, so a process that calls asyncio.run
+# more than once gets a fresh pool per loop instead of a dead one. No lock:
+# the check-and-create below has no await, so it is atomic within a loop
+_CONNECTORS: Dict[asyncio.AbstractEventLoop, aiohttp.TCPConnector] = {}
 
-# JavaScript/TypeScript Example
-JAVASCRIPT_EXAMPLE = '''
-// JavaScript/TypeScript Frontend Integration
-class PromptToJsonAPI {
-    constructor(baseURL = 'http://localhost:8000') {
-        this.baseURL = baseURL;
-    }
+async def _get_connector() -> aiohttp.TCPConnector:
+    loop = asyncio.get_running_loop()
+    connector = _CONNECTORS.get(loop)
+    if connector is None or connector.closed:
+        # Drop pools whose loops have exited so finished asyncio.run calls
+        # don't accumulate entries
+        for stale in [l for l in _CONNECTORS if l.is_closed()]:
+            del _CONNECTORS[stale]
+        connector = aiohttp.TCPConnector(
+            limit=200, limit_per_host=64,
+            ttl_dns_cache=300, keepalive_timeout=30,
+            enable_cleanup_closed=True
+        )
+        _CONNECTORS[loop] = connector
+    return connector
 
-    async generateSpec(prompt) {
-        const response = await fetch(`${this.baseURL}/generate`, {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-            },
-            body: JSON.stringify({ prompt })
-        });
-        
-        if (!response.ok) {
-            throw new Error(`HTTP error! status: ${response.status}`);
-        }
-        
-        return await response.json();
-    }
+async def shutdown_pool():
+    """Close the current loop's shared connector on application shutdown"""
+    connector = _CONNECTORS.pop(asyncio.get_running_loop(), None)
+    if connector is not None and not connector.closed:
+        await connector.close()
 
-    async evaluateSpec(prompt, spec) {
-        const response = await fetch(`${this.baseURL}/evaluate`, {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-            },
-            body: JSON.stringify({ prompt, spec })
-        });
-        
-        return await response.json();
-    }
-
-    async iterateSpec(spec, maxIters = 3) {
-        const response = await fetch(`${this.baseURL}/iterate`, {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-            },
-            body: JSON.stringify({ spec, max_iters: maxIters })
-        });
-        
-        return await response.json();
-    }
+class AsyncPromptToJsonClient:
+    """Async Python client for high-performance applications"""
 
-    async getReport(reportId) {
-        const response = await fetch(`${this.baseURL}/reports/${reportId}`);
-        return await response.json();
-    }
+    def __init__(self, base_url: str = "http://localhost:8000", max_concurrency: int = 32):
+        self.base_url = base_url.rstrip("/")
+        self.max_concurrency = max_concurrency
+        self._session: Optional[aiohttp.ClientSession] = None
 
-    async logValues(values) {
-        const response = await fetch(`${this.baseURL}/log-values`, {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-            },
-            body: JSON.stringify(values)
-        });
-        
-        return await response.json();
-    }
-}
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Lazily create one long-lived session on the shared connector"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=await _get_connector(),
+                connector_owner=False,
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self._session
 
-// Usage Example
-const api = new PromptToJsonAPI();
+    async def close(self):
+        """Close the underlying session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
 
-async function processPrompt(userInput) {
-    try {
-        // Generate initial spec
-        const spec = await api.generateSpec(userInput);
-        console.log('Generated spec:', spec);
-        
-        // Evaluate quality
-        const evaluation = await api.evaluateSpec(userInput, spec);
-        console.log('Evaluation:', evaluation);
-        
-        // Improve with RL if score is low
-        if (evaluation.score < 8) {
-            const improved = await api.iterateSpec(spec, 3);
-            console.log('Improved spec:', improved.final_spec);
-            return improved.final_spec;
-        }
-        
-        return spec;
-    } catch (error) {
-        console.error('API Error:', error);
-        throw error;
-    }
-}
-'''
+    async def __aenter__(self):
+        await self._get_session()
+        return self
 
-# React Component Example
-REACT_EXAMPLE = '''
-// React Component Example
-import React, { useState, useCallback } from 'react';
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
 
-const PromptToJsonGenerator = () => {
-    const [prompt, setPrompt] = useState('');
-    const [spec, setSpec] = useState(null);
-    const [loading, setLoading] = useState(false);
-    const [error, setError] = useState(null);
+    async def generate_spec(self, prompt: str) -> Dict[str, Any]:
+        """Async generate specification"""
+        session = await self._get_session()
+        async with session.post(
+            f"{self.base_url}/generate",
+            json={"prompt": prompt}
+        ) as response:
+            response.raise_for_status()
+            return await response.json()
 
-    const generateSpec = useCallback(async () => {
-        if (!prompt.trim()) return;
-        
-        setLoading(true);
-        setError(null);
-        
-        try {
-            const response = await fetch('http://localhost:8000/generate', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                body: JSON.stringify({ prompt })
-            });
-            
-            if (!response.ok) {
-                throw new Error(`HTTP error! status: ${response.status}`);
-            }
-            
-            const result = await response.json();
-            setSpec(result);
-        } catch (err) {
-            setError(err.message);
-        } finally {
-            setLoading(false);
-        }
-    }, [prompt]);
+    async def _generate_one(self, session, sem, index: int, prompt: str):
+        """POST one prompt and drain its body, bounded by the semaphore"""
+        async with sem:
+            async with session.post(
+                f"{self.base_url}/generate",
+                json={"prompt": prompt}
+            ) as response:
+                response.raise_for_status()
+                return index, await response.json()
 
-    return (
-        <div className="prompt-generator">
-            <h2>Prompt to JSON Generator</h2>
-            
-            <div className="input-section">
-                <textarea
-                    value={prompt}
-                    onChange={(e) => setPrompt(e.target.value)}
-                    placeholder="Enter your design prompt..."
-                    rows={4}
-                    cols={50}
-                />
-                <br />
-                <button 
-                    onClick={generateSpec} 
-                    disabled={loading || !prompt.trim()}
-                >
-                    {loading ? 'Generating...' : 'Generate Specification'}
-                </button>
-            </div>
+    async def batch_generate_stream(self, prompts: list):
+        """Yield (index, spec) pairs as each request finishes, fastest first"""
+        session = await self._get_session()
+        sem = asyncio.Semaphore(self.max_concurrency)
 
-            {error && (
-                <div className="error">
-                    Error: {error}
-                </div>
-            )}
+        tasks = [self._generate_one(session, sem, i, p) for i, p in enumerate(prompts)]
+        for fut in asyncio.as_completed(tasks):
+            yield await fut
 
-            {spec && (
-                <div className="result-section">
-                    <h3>Generated Specification:</h3>
-                    <pre>{JSON.stringify(spec, null, 2)}</pre>
-                </div>
-            )}
-        </div>
-    );
-};
+    async def batch_generate(self, prompts: list) -> list:
+        """Generate multiple specs concurrently, preserving prompt order"""
+        results = [None] * len(prompts)
+        async for index, spec in self.batch_generate_stream(prompts):
+            results[index] = spec
+        return results
 
-export default PromptToJsonGenerator;
-'''
+# The JS/React/Vue example sources live under examples/ and are read on
+# demand, so importing this module does not keep several kB of literal
+# strings resident (or baked into the .pyc) for consumers that never
+# print them
+_EXAMPLES_DIR = Path(__file__).resolve().parent / "examples"
 
-# Vue.js Example
-VUE_EXAMPLE = '''
-<!-- Vue.js Component Example -->
-<template>
-  <div class="prompt-generator">
-    <h2>Prompt to JSON Generator</h2>
-    
-    <div class="input-section">
-      <textarea
-        v-model="prompt"
-        placeholder="Enter your design prompt..."
-        :rows="4"
-        :cols="50"
-      ></textarea>
-      <br />
-      <button 
-        @click="generateSpec" 
-        :disabled="loading || !prompt.trim()"
-      >
-        {{ loading ? 'Generating...' : 'Generate Specification' }}
-      </button>
-    </div>
+@functools.lru_cache(maxsize=None)
+def _load_example(filename: str) -> str:
+    return (_EXAMPLES_DIR / filename).read_text()
 
-    <div v-if="error" class="error">
-      Error: {{ error }}
-    </div>
+def get_javascript_example() -> str:
+    """JavaScript/TypeScript integration example source"""
+    return _load_example("javascript_example.js")
 
-    <div v-if="spec" class="result-section">
-      <h3>Generated Specification:</h3>
-      <pre>{{ JSON.stringify(spec, null, 2) }}</pre>
-    </div>
-  </div>
-</template>
+def get_react_example() -> str:
+    """React component example source"""
+    return _load_example("react_example.jsx")
 
-<script>
-export default {
-  name: 'PromptToJsonGenerator',
-  data() {
-    return {
-      prompt: '',
-      spec: null,
-      loading: false,
-      error: null
-    };
-  },
-  methods: {
-    async generateSpec() {
-      if (!this.prompt.trim()) return;
-      
-      this.loading = true;
-      this.error = null;
-      
-      try {
-        const response = await fetch('http://localhost:8000/generate', {
-          method: 'POST',
-          headers: {
-            'Content-Type': 'application/json',
-          },
-          body: JSON.stringify({ prompt: this.prompt })
-        });
-        
-        if (!response.ok) {
-          throw new Error(`HTTP error! status: ${response.status}`);
-        }
-        
-        this.spec = await response.json();
-      } catch (err) {
-        this.error = err.message;
-      } finally {
-        this.loading = false;
-      }
-    }
-  }
-};
-</script>
-'''
+def get_vue_example() -> str:
+    """Vue.js component example source"""
+    return _load_example("vue_example.vue")
 
 def demo_python_client():
     """Demonstrate Python client usage"""
@@ -361,7 +221,7 @@ def demo_python_client():
         # Generate spec
         prompt = "Design a lightweight carbon fiber racing drone"
         spec = client.generate_spec(prompt)
-        print("📝 Generated Spec:", json.dumps(spec, indent=2))
+        print("📝 Generated Spec:", orjson.dumps(spec, option=orjson.OPT_INDENT_2).decode())
         
         # Evaluate spec
         evaluation = client.evaluate_spec(prompt, spec)
@@ -370,7 +230,7 @@ def demo_python_client():
         # Iterate if needed
         if evaluation["score"] < 8:
             improved = client.iterate_spec(spec, max_iters=2)
-            print("🔄 Improved Spec:", json.dumps(improved["final_spec"], indent=2))
+            print("🔄 Improved Spec:", orjson.dumps(improved["final_spec"], option=orjson.OPT_INDENT_2).decode())
         
         # Log values
         values_result = client.log_values(
@@ -386,19 +246,23 @@ def demo_python_client():
 
 async def demo_async_client():
     """Demonstrate async client usage"""
-    client = AsyncPromptToJsonClient()
-    
+    # Eager tasks (Python 3.12+) let fast coroutines finish without an extra
+    # event-loop round-trip, which speeds up gather-heavy batch calls
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     prompts = [
         "Design a sports car",
-        "Create a modern office building", 
+        "Create a modern office building",
         "Build a surveillance drone"
     ]
-    
+
     try:
-        # Batch generate specs
-        specs = await client.batch_generate(prompts)
+        # Batch generate specs over one shared session
+        async with AsyncPromptToJsonClient() as client:
+            specs = await client.batch_generate(prompts)
         for i, spec in enumerate(specs):
-            print(f"Spec {i+1}:", json.dumps(spec, indent=2))
+            print(f"Spec {i+1}:", orjson.dumps(spec, option=orjson.OPT_INDENT_2).decode())
     except Exception as e:
         print(f"❌ Async Error: {e}")
 
@@ -413,10 +277,10 @@ if __name__ == "__main__":
     asyncio.run(demo_async_client())
     
     print("\n💻 JavaScript Example:")
-    print(JAVASCRIPT_EXAMPLE)
+    print(get_javascript_example())
     
     print("\n⚛️ React Example:")
-    print(REACT_EXAMPLE)
+    print(get_react_example())
     
     print("\n🖖 Vue.js Example:")
-    print(VUE_EXAMPLE)
\ No newline at end of file
+    print(get_vue_example())
\ No newline at end of file
@@ -1,164 +1,207 @@
+from collections import namedtuple
 from typing import Dict, List
 import json
 
+import httpx
+
+from config import get_settings
+
+# One pooled keep-alive client per process; remote LLM backends (e.g. the
+# OpenAI SDK's http_client parameter) should reuse it instead of building
+# their own connection pool per agent
+_HTTP_CLIENT = None
+
+def _get_http_client() -> httpx.Client:
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        _HTTP_CLIENT = httpx.Client(
+            timeout=get_settings().request_timeout,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+            headers={"Connection": "keep-alive"}
+        )
+    return _HTTP_CLIENT
+
+# Shared across instances — ordered tuples keep top-N suggestion order, the
+# *_set twins give O(1) membership for analysis
+_DOMAIN_EXPERTISE = {
+    "automotive": {
+        "materials": ("aluminum", "steel", "carbon fiber", "plastic", "rubber"),
+        "typical_dimensions": {"car": "4.5x1.8x1.4m", "truck": "6.0x2.5x2.8m"},
+        "safety_requirements": ("crash safety", "emissions", "fuel efficiency"),
+        "colors": ("red", "blue", "black", "white", "silver")
+    },
+    "construction": {
+        "materials": ("concrete", "steel", "wood", "glass", "brick"),
+        "typical_dimensions": {"house": "12x10x3m", "office": "20x15x8m"},
+        "building_codes": ("structural integrity", "fire safety", "accessibility"),
+        "colors": ("white", "gray", "brown", "beige")
+    },
+    "aerospace": {
+        "materials": ("carbon fiber", "aluminum", "titanium", "composite"),
+        "typical_dimensions": {"drone": "50x50x15cm", "aircraft": "10x8x2m"},
+        "regulations": ("weight limits", "flight safety", "communication"),
+        "colors": ("white", "gray", "black")
+    }
+}
+
+for _info in _DOMAIN_EXPERTISE.values():
+    _info["materials_set"] = frozenset(_info["materials"])
+
+_REQUIRED_FIELDS = ("type", "material", "dimensions", "purpose")
+# Percentage contributed by each filled field, precomputed once
+_COMPLETENESS_STEP = 100.0 / len(_REQUIRED_FIELDS)
+
+_DOMAIN_MAP = {
+    "car": "automotive",
+    "building": "construction",
+    "house": "construction",
+    "office": "construction",
+    "drone": "aerospace",
+    "aircraft": "aerospace"
+}
+
+_PURPOSE_SUGGESTIONS = {
+    "car": "transportation, racing, commuting",
+    "building": "residential, commercial, industrial",
+    "drone": "surveillance, delivery, photography",
+    "table": "dining, office work, display"
+}
+
+# All per-spec fields the helpers need, extracted once per request
+_SpecView = namedtuple("_SpecView", "obj_type materials dimensions purpose color domain completeness")
+
+def _view(spec: Dict) -> _SpecView:
+    """Read each spec field once and precompute the shared domain/completeness"""
+    obj_type = spec.get("type", "unknown")
+    materials = spec.get("material", [])
+    dimensions = spec.get("dimensions")
+    purpose = spec.get("purpose")
+
+    filled_fields = sum(1 for value in (spec.get("type"), materials, dimensions, purpose) if value)
+
+    return _SpecView(
+        obj_type, materials, dimensions, purpose, spec.get("color"),
+        _DOMAIN_MAP.get(obj_type), filled_fields * _COMPLETENESS_STEP
+    )
+
 class LLMFeedbackAgent:
     """LLM-style intelligent feedback system"""
-    
+
     def __init__(self):
-        self.domain_expertise = {
-            "automotive": {
-                "materials": ["aluminum", "steel", "carbon fiber", "plastic", "rubber"],
-                "typical_dimensions": {"car": "4.5x1.8x1.4m", "truck": "6.0x2.5x2.8m"},
-                "safety_requirements": ["crash safety", "emissions", "fuel efficiency"],
-                "colors": ["red", "blue", "black", "white", "silver"]
-            },
-            "construction": {
-                "materials": ["concrete", "steel", "wood", "glass", "brick"],
-                "typical_dimensions": {"house": "12x10x3m", "office": "20x15x8m"},
-                "building_codes": ["structural integrity", "fire safety", "accessibility"],
-                "colors": ["white", "gray", "brown", "beige"]
-            },
-            "aerospace": {
-                "materials": ["carbon fiber", "aluminum", "titanium", "composite"],
-                "typical_dimensions": {"drone": "50x50x15cm", "aircraft": "10x8x2m"},
-                "regulations": ["weight limits", "flight safety", "communication"],
-                "colors": ["white", "gray", "black"]
-            }
-        }
-    
+        # Feedback is currently generated locally; the shared client is bound
+        # here so any remote backend reuses pooled connections
+        self.http_client = _get_http_client()
+        self.domain_expertise = _DOMAIN_EXPERTISE
+
     def analyze_spec_quality(self, spec: Dict) -> Dict:
         """Analyze spec quality with domain expertise"""
+        return self._analyze(_view(spec))
+
+    def _analyze(self, view: _SpecView) -> Dict:
         analysis = {
-            "completeness": 0,
+            "completeness": view.completeness,
             "realism": 0,
             "domain_compliance": 0,
             "suggestions": []
         }
-        
-        obj_type = spec.get("type", "unknown")
-        materials = spec.get("material", [])
-        dimensions = spec.get("dimensions")
-        purpose = spec.get("purpose")
-        
-        # Completeness analysis
-        required_fields = ["type", "material", "dimensions", "purpose"]
-        filled_fields = sum(1 for field in required_fields if spec.get(field))
-        analysis["completeness"] = (filled_fields / len(required_fields)) * 100
-        
-        # Realism analysis
-        domain = self._get_domain(obj_type)
-        if domain and materials:
-            realistic_materials = self.domain_expertise[domain]["materials"]
-            realistic_count = sum(1 for mat in materials if mat in realistic_materials)
-            analysis["realism"] = (realistic_count / len(materials)) * 100 if materials else 0
-        
+
+        # Realism analysis - hashed membership tests, counted per occurrence
+        # so duplicate entries weigh the same as they always have
+        if view.domain and view.materials:
+            materials_set = self.domain_expertise[view.domain]["materials_set"]
+            realistic_count = sum(1 for m in view.materials if m in materials_set)
+            analysis["realism"] = (realistic_count / len(view.materials)) * 100
+
         return analysis
-    
+
     def generate_intelligent_critique(self, spec: Dict, evaluation: Dict) -> List[str]:
         """Generate intelligent, contextual critique"""
+        return self._critique(_view(spec), evaluation.get("spec_score", 0))
+
+    def _critique(self, view: _SpecView, score: int) -> List[str]:
         critiques = []
-        obj_type = spec.get("type", "unknown")
-        score = evaluation.get("spec_score", 0)
-        
-        # Domain-specific analysis
-        domain = self._get_domain(obj_type)
-        
+
         if score < 8:
             critiques.append(f"Specification quality is below optimal (score: {score}/10)")
-        
+
         # Missing dimensions critique
-        if not spec.get("dimensions"):
-            if domain == "automotive":
+        if not view.dimensions:
+            if view.domain == "automotive":
                 critiques.append("Missing critical dimensions. For automotive applications, precise measurements are essential for manufacturing and safety compliance.")
-            elif domain == "construction":
+            elif view.domain == "construction":
                 critiques.append("Dimensions required for structural calculations and building permits. Consider standard room sizes or building footprints.")
             else:
                 critiques.append("Dimensions needed for manufacturing feasibility and cost estimation.")
-        
+
         # Material analysis
-        materials = spec.get("material", [])
-        if not materials or materials == ["unknown"]:
-            if domain == "automotive":
+        if not view.materials or view.materials == ["unknown"]:
+            if view.domain == "automotive":
                 critiques.append("Material selection critical for performance, weight, and safety. Consider aluminum for lightweight, steel for strength.")
-            elif domain == "construction":
+            elif view.domain == "construction":
                 critiques.append("Building materials must meet structural and environmental requirements. Concrete and steel are common for load-bearing.")
             else:
                 critiques.append("Material choice affects durability, cost, and manufacturing process.")
-        
+
         # Purpose analysis
-        if not spec.get("purpose"):
+        if not view.purpose:
             critiques.append("Purpose definition helps optimize design parameters and material selection for intended use case.")
-        
+
         return critiques
-    
+
     def suggest_improvements(self, spec: Dict, evaluation: Dict) -> List[str]:
         """Generate intelligent improvement suggestions"""
+        return self._suggest(_view(spec))
+
+    def _suggest(self, view: _SpecView) -> List[str]:
         suggestions = []
-        obj_type = spec.get("type", "unknown")
-        domain = self._get_domain(obj_type)
-        
+        obj_type = view.obj_type
+
         # Dimension suggestions
-        if not spec.get("dimensions"):
-            if domain and obj_type in self.domain_expertise[domain]["typical_dimensions"]:
-                typical = self.domain_expertise[domain]["typical_dimensions"][obj_type]
+        if not view.dimensions:
+            if view.domain and obj_type in self.domain_expertise[view.domain]["typical_dimensions"]:
+                typical = self.domain_expertise[view.domain]["typical_dimensions"][obj_type]
                 suggestions.append(f"Consider typical {obj_type} dimensions: {typical}")
             else:
                 suggestions.append("Add specific dimensions (length x width x height) with appropriate units")
-        
+
         # Material optimization
-        materials = spec.get("material", [])
-        if domain and (not materials or materials == ["unknown"]):
-            recommended = self.domain_expertise[domain]["materials"][:2]
+        if view.domain and (not view.materials or view.materials == ["unknown"]):
+            recommended = self.domain_expertise[view.domain]["materials"][:2]
             suggestions.append(f"Recommended materials for {obj_type}: {', '.join(recommended)}")
-        
+
         # Purpose enhancement
-        if not spec.get("purpose"):
-            purpose_suggestions = {
-                "car": "transportation, racing, commuting",
-                "building": "residential, commercial, industrial",
-                "drone": "surveillance, delivery, photography",
-                "table": "dining, office work, display"
-            }
-            if obj_type in purpose_suggestions:
-                suggestions.append(f"Consider purpose: {purpose_suggestions[obj_type]}")
-        
+        if not view.purpose:
+            if obj_type in _PURPOSE_SUGGESTIONS:
+                suggestions.append(f"Consider purpose: {_PURPOSE_SUGGESTIONS[obj_type]}")
+
         # Color recommendations
-        if not spec.get("color") and domain:
-            colors = self.domain_expertise[domain]["colors"][:3]
+        if not view.color and view.domain:
+            colors = self.domain_expertise[view.domain]["colors"][:3]
             suggestions.append(f"Popular colors for {obj_type}: {', '.join(colors)}")
-        
+
         return suggestions
-    
-    def _get_domain(self, obj_type: str) -> str:
-        """Map object type to domain"""
-        domain_map = {
-            "car": "automotive",
-            "building": "construction", 
-            "house": "construction",
-            "office": "construction",
-            "drone": "aerospace",
-            "aircraft": "aerospace"
-        }
-        return domain_map.get(obj_type)
-    
+
     def generate_comprehensive_feedback(self, spec: Dict, evaluation: Dict) -> Dict:
         """Generate comprehensive LLM-style feedback"""
-        analysis = self.analyze_spec_quality(spec)
-        critiques = self.generate_intelligent_critique(spec, evaluation)
-        suggestions = self.suggest_improvements(spec, evaluation)
-        
+        # One view shared by every helper instead of re-reading the spec dict
+        view = _view(spec)
+        score = evaluation.get("spec_score", 0)
+
+        analysis = self._analyze(view)
+        critiques = self._critique(view, score)
+        suggestions = self._suggest(view)
+
         return {
             "quality_analysis": analysis,
             "critiques": critiques,
             "improvement_suggestions": suggestions,
-            "overall_assessment": self._generate_assessment(spec, evaluation, analysis)
+            "overall_assessment": self._generate_assessment(score, analysis)
         }
-    
-    def _generate_assessment(self, spec: Dict, evaluation: Dict, analysis: Dict) -> str:
+
+    def _generate_assessment(self, score: int, analysis: Dict) -> str:
         """Generate overall assessment"""
-        score = evaluation.get("spec_score", 0)
         completeness = analysis["completeness"]
-        
+
         if score >= 9:
             return "Excellent specification with comprehensive details and realistic parameters."
         elif score >= 7:
@@ -166,4 +209,4 @@ class LLMFeedbackAgent:
         elif score >= 5:
             return f"Adequate specification requiring significant enhancements for production readiness."
         else:
-            return f"Incomplete specification ({completeness:.0f}% complete) requiring major improvements."
\ No newline at end of file
+            return f"Incomplete specification ({completeness:.0f}% complete) requiring major improvements."
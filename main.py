@@ -1,8 +1,17 @@
-from fastapi import FastAPI, Depends, HTTPException
+import hashlib
+import re
+from types import MappingProxyType
+
+import orjson
+from fastapi import FastAPI, Depends, HTTPException, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from pydantic import BaseModel
 
+from cache import cached, response_cache
+
 # Simple schemas
 class PromptIn(BaseModel):
     prompt: str
@@ -11,81 +20,138 @@ class SpecIn(BaseModel):
     prompt: str
     spec: Dict[str, Any]
 
+class BatchIn(BaseModel):
+    items: List[SpecIn]
+
 class IterateIn(BaseModel):
     spec: Optional[Dict[str, Any]] = None
     spec_id: Optional[str] = None
     max_iters: Optional[int] = 3
 
+class PipelineIn(BaseModel):
+    prompt: str
+    score_threshold: Optional[int] = 8
+
 class ValuesIn(BaseModel):
     honesty: Optional[str] = None
     integrity: Optional[str] = None
     discipline: Optional[str] = None
     gratitude: Optional[str] = None
 
+# Frozen spec templates + one compiled alternation: a single left-to-right scan
+# replaces the chain of substring tests as more object types get added
+_TYPE_RE = re.compile(r"car|building")
+
+# Tuples for material: lists would be shared mutably across the shallow
+# copies handed to callers, and tuples serialize to the same JSON arrays
+_SPEC_TEMPLATES = MappingProxyType({
+    "car": MappingProxyType({"type": "car", "material": ("steel",), "dimensions": "4.5x1.8x1.4m", "color": None, "purpose": "transportation", "extras": None}),
+    "building": MappingProxyType({"type": "building", "material": ("concrete",), "dimensions": "20x15x8m", "color": None, "purpose": "office", "extras": None}),
+    "object": MappingProxyType({"type": "object", "material": ("steel",), "dimensions": "100x50x30cm", "color": None, "purpose": "general use", "extras": None}),
+})
+
 # Simple agent
 class SimpleAgent:
     def run(self, input_data):
         prompt = input_data.get("prompt", "").lower()
-        if "car" in prompt:
-            return {"type": "car", "material": ["steel"], "dimensions": "4.5x1.8x1.4m", "color": "red" if "red" in prompt else None, "purpose": "transportation", "extras": None}
-        elif "building" in prompt:
-            return {"type": "building", "material": ["concrete"], "dimensions": "20x15x8m", "color": None, "purpose": "office", "extras": None}
-        return {"type": "object", "material": ["steel"], "dimensions": "100x50x30cm", "color": None, "purpose": "general use", "extras": None}
+        match = _TYPE_RE.search(prompt)
+        template = _SPEC_TEMPLATES[match.group(0)] if match else _SPEC_TEMPLATES["object"]
+
+        # Shallow copy keeps the shared template immutable
+        spec = {**template}
+        if spec["type"] == "car" and "red" in prompt:
+            spec["color"] = "red"
+        return spec
+
+# Mock database functions — each saver used to define a fresh class per
+# call; a single slotted row type with shared instances removes that
+# per-request class construction and dict allocation
+class _MockRow:
+    __slots__ = ("id",)
+
+    def __init__(self, id):
+        self.id = id
+
+_MOCK_SPEC_ROW = _MockRow("mock-spec-id")
+_MOCK_REPORT_ROW = _MockRow("mock-report-id")
+_MOCK_VALUES_ROW = _MockRow("mock-values-id")
 
-# Mock database functions
 def mock_get_db():
     return None
 
 def mock_save_spec(db, prompt, spec):
-    class MockSpec:
-        id = "mock-spec-id"
-    return MockSpec()
+    return _MOCK_SPEC_ROW
 
 def mock_save_report(db, spec_id, evaluation, score):
-    class MockReport:
-        id = "mock-report-id"
-    return MockReport()
+    return _MOCK_REPORT_ROW
 
 def mock_get_report(db, report_id):
     return {"id": report_id, "evaluation": {}, "score": 8}
 
 def mock_save_values_log(db, **kwargs):
-    class MockValues:
-        id = "mock-values-id"
-    return MockValues()
+    return _MOCK_VALUES_ROW
 
 # Initialize app and agent
-app = FastAPI(title="Prompt to JSON Agent API", version="1.0.0")
+# orjson serializes straight to bytes, skipping stdlib json + UTF-8 encode
+app = FastAPI(title="Prompt to JSON Agent API", version="1.0.0", default_response_class=ORJSONResponse)
+# Compress responses over 512 bytes; level 5 trades a little ratio for CPU
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
 prompt_agent = SimpleAgent()
 
 @app.post("/generate")
+@cached(response_cache)
 def generate(payload: PromptIn):
-    out = prompt_agent.run(payload.dict())
+    out = prompt_agent.run({"prompt": payload.prompt})
     return out
 
+# Precomputed scores for every field-presence combination: base 5, +1 type,
+# +1 material, +2 dimensions, +1 color, capped at 10. Indexing replaces the
+# per-request branch chain.
+_SCORE_LUT = tuple(
+    min(5 + (m & 1) + (m >> 1 & 1) + 2 * (m >> 2 & 1) + (m >> 3 & 1), 10)
+    for m in range(16)
+)
+
+def _score(spec):
+    mask = (
+        bool(spec.get("type"))
+        | bool(spec.get("material")) << 1
+        | bool(spec.get("dimensions")) << 2
+        | bool(spec.get("color")) << 3
+    )
+    return _SCORE_LUT[mask]
+
+def _evaluate_one(prompt, spec):
+    score = _score(spec)
+    spec_row = mock_save_spec(None, prompt, spec)
+    report_row = mock_save_report(None, spec_row.id, {}, score)
+    return {"report_id": report_row.id, "score": score}
+
 @app.post("/evaluate")
+@cached(response_cache)
 def evaluate(payload: SpecIn):
-    spec = payload.spec
-    score = 5
-    if spec.get("type"): score += 1
-    if spec.get("material"): score += 1
-    if spec.get("dimensions"): score += 2
-    if spec.get("color"): score += 1
-    
-    spec_row = mock_save_spec(None, payload.prompt, payload.spec)
-    report_row = mock_save_report(None, spec_row.id, {}, min(score, 10))
-    return {"report_id": report_row.id, "score": min(score, 10)}
+    return _evaluate_one(payload.prompt, payload.spec)
+
+@app.post("/evaluate/batch")
+def evaluate_batch(payload: BatchIn):
+    # One request body for many specs amortizes HTTP framing and dispatch overhead
+    return {"results": [_evaluate_one(item.prompt, item.spec) for item in payload.items]}
 
 @app.post("/iterate")
+@cached(response_cache)
 def iterate(payload: IterateIn):
     if not payload.spec:
         raise HTTPException(status_code=400, detail="spec required")
     
     spec = payload.spec
-    improved_spec = spec.copy()
+    # Already complete — skip the copy and report a no-op iteration
+    if spec.get("color") and spec.get("purpose"):
+        return {"iterations": 0, "history": [], "final_spec": spec}
+
+    improved_spec = {**spec}
     if not improved_spec.get("color"): improved_spec["color"] = "gray"
     if not improved_spec.get("purpose"): improved_spec["purpose"] = "general use"
-    
+
     return {
         "iterations": 1,
         "history": [{
@@ -98,21 +164,56 @@ def iterate(payload: IterateIn):
         "final_spec": improved_spec
     }
 
+@app.post("/pipeline")
+def pipeline(payload: PipelineIn):
+    # Generate + evaluate + (maybe) iterate in one round-trip instead of three
+    spec = prompt_agent.run({"prompt": payload.prompt})
+    evaluation = _evaluate_one(payload.prompt, spec)
+
+    final_spec = spec
+    iterated = False
+    if evaluation["score"] < payload.score_threshold and not (spec.get("color") and spec.get("purpose")):
+        final_spec = {**spec}
+        if not final_spec.get("color"): final_spec["color"] = "gray"
+        if not final_spec.get("purpose"): final_spec["purpose"] = "general use"
+        iterated = True
+
+    return {"spec": spec, "evaluation": evaluation, "iterated": iterated, "final_spec": final_spec}
+
+def _etag_response(body, request: Request, response: Response, max_age: int = 60):
+    """Attach a strong ETag; answer matching If-None-Match polls with a 304"""
+    tag = hashlib.blake2b(orjson.dumps(body), digest_size=8).hexdigest()
+    if request.headers.get("if-none-match") == tag:
+        return Response(status_code=304)
+
+    response.headers["ETag"] = tag
+    response.headers["Cache-Control"] = f"public, max-age={max_age}"
+    return body
+
 @app.get("/reports/{report_id}")
-def get_report_by_id(report_id: str):
-    return mock_get_report(None, report_id)
+def get_report_by_id(report_id: str, request: Request, response: Response):
+    return _etag_response(mock_get_report(None, report_id), request, response)
 
 @app.post("/log-values")
 def log_values(payload: ValuesIn):
-    values_log = mock_save_values_log(None, **payload.dict())
+    values_log = mock_save_values_log(None, **payload.model_dump(exclude_none=True))
     return {"id": values_log.id, "message": "Values logged successfully"}
 
+# Serialized once at import; probes hit this every second per instance, so
+# skip dict construction and response-model serialization entirely
+_HEALTH_JSON = orjson.dumps({"status": "ok", "service": "prompt-to-json-agent"})
+
 @app.get("/health")
 def health():
-    return {"status": "ok", "service": "prompt-to-json-agent"}
+    # Short max-age keeps liveness probes from re-hitting the app every poll
+    return Response(
+        content=_HEALTH_JSON,
+        media_type="application/json",
+        headers={"Cache-Control": "max-age=5"},
+    )
 
 @app.get("/metrics")
 def get_metrics():
-    return {"total_requests": 0, "success_rate": 100, "avg_response_time": 0.1}
+    return {"total_requests": 0, "success_rate": 100, "avg_response_time": 0.1, **response_cache.stats()}
 
-# run with: uvicorn app.main:app --reload --host 0.0.0.0 --port 8000
\ No newline at end of file
+# dev: python run_dev.py (auto-reload) | production: python run.py
\ No newline at end of file
@@ -1,44 +1,57 @@
-from sqlalchemy import Column, String, Integer, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Index, String, Integer, Text, DateTime, ForeignKey, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
-import uuid
 from app.db import Base
 
+# Primary keys are generated server-side (PG13+ ships gen_random_uuid built
+# in), so inserts skip the client-side uuid4 call and eager_defaults makes
+# SQLAlchemy fetch the id via RETURNING in the same round-trip.
+# created_at uses clock_timestamp() so rows get truly monotonic times even
+# within one transaction, keeping the column usable as an insertion-ordered
+# range key
+
 class Spec(Base):
     __tablename__ = "specs"
-    
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     prompt = Column(Text, nullable=False)
     spec = Column(JSONB, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=text("clock_timestamp()"))
 
 class Report(Base):
     __tablename__ = "reports"
-    
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     spec_id = Column(UUID(as_uuid=True), ForeignKey("specs.id"))
     evaluation = Column(JSONB)
     score = Column(Integer)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=text("clock_timestamp()"))
 
 class FeedbackLog(Base):
     __tablename__ = "feedback_logs"
-    
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __mapper_args__ = {"eager_defaults": True}
+    # BRIN suits the insert-ordered created_at column: block-range metadata
+    # keeps recent-window scans cheap at a fraction of a B-tree's size
+    __table_args__ = (Index("ix_feedback_logs_created_brin", "created_at", postgresql_using="brin"),)
+
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     spec_id = Column(UUID(as_uuid=True))
     iteration = Column(Integer)
     before = Column(JSONB)
     after = Column(JSONB)
     feedback = Column(JSONB)
     reward = Column(Integer)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=text("clock_timestamp()"))
 
 class ValuesLog(Base):
     __tablename__ = "values_logs"
-    
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     honesty = Column(Text)
     integrity = Column(Text)
     discipline = Column(Text)
     gratitude = Column(Text)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
\ No newline at end of file
+    created_at = Column(DateTime(timezone=True), server_default=text("clock_timestamp()"))
@@ -3,16 +3,46 @@ Production monitoring and logging system
 Tracks API performance, errors, and usage metrics
 """
 
+import atexit
 import logging
+import queue
 import time
 import json
-from datetime import datetime
+from collections import Counter, deque
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Dict, Any
 from functools import wraps
+import orjson
 import psutil
 import os
 
+# Timestamp cache at 1ms resolution: bursts of events in the same tick share
+# one datetime.now() result, checked with the much cheaper monotonic_ns.
+# Timestamps are naive UTC because the serializer stamps them with
+# OPT_NAIVE_UTC, which assumes exactly that
+_NOW_CACHE = [0, None]
+
+def _cached_now():
+    now_ns = time.monotonic_ns()
+    if _NOW_CACHE[1] is None or now_ns - _NOW_CACHE[0] >= 1_000_000:
+        _NOW_CACHE[0] = now_ns
+        _NOW_CACHE[1] = datetime.now(timezone.utc).replace(tzinfo=None)
+    return _NOW_CACHE[1]
+
+class _JsonMessage:
+    """Log message that serializes only if the record is actually emitted"""
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        self.data = data
+
+    def __str__(self):
+        # orjson handles datetime natively, so callers pass the object instead
+        # of paying for isoformat() up front
+        return orjson.dumps(self.data, option=orjson.OPT_NAIVE_UTC).decode()
+
 class ProductionMonitor:
     def __init__(self, log_dir: str = "logs"):
         self.log_dir = Path(log_dir)
@@ -21,18 +51,41 @@ class ProductionMonitor:
         # Setup loggers
         self.setup_loggers()
         
-        # Metrics storage
+        # Metrics storage — response times are a bounded ring buffer with a
+        # running sum, so memory stays constant and the average is O(1)
         self.metrics = {
             "requests_total": 0,
             "requests_success": 0,
             "requests_error": 0,
-            "response_times": [],
-            "error_counts": {},
-            "endpoint_usage": {}
+            "response_times": deque(maxlen=10000),
+            "error_counts": Counter(),
+            "endpoint_usage": Counter()
         }
+        self._rt_sum = 0.0
+
+        # Prime the CPU sampler so later interval=None reads return the delta
+        # since this call instead of a meaningless 0.0
+        psutil.cpu_percent(interval=None)
+        self._disk_cache = (0.0, None)
     
+    def _attach_queued_handler(self, logger, file_handler):
+        """Route a logger through a queue so disk writes happen off-thread
+
+        The request thread only pays for a queue put; a single listener
+        thread drains records into the blocking FileHandler.
+        """
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+
+        listener = QueueListener(log_queue, file_handler)
+        listener.start()
+        self._listeners.append(listener)
+        atexit.register(listener.stop)
+
     def setup_loggers(self):
         """Setup structured logging"""
+        self._listeners = []
+
         # API access logger
         self.api_logger = logging.getLogger("api_access")
         api_handler = logging.FileHandler(self.log_dir / "api_access.log")
@@ -40,9 +93,9 @@ class ProductionMonitor:
             '%(asctime)s - %(levelname)s - %(message)s'
         )
         api_handler.setFormatter(api_formatter)
-        self.api_logger.addHandler(api_handler)
+        self._attach_queued_handler(self.api_logger, api_handler)
         self.api_logger.setLevel(logging.INFO)
-        
+
         # Error logger
         self.error_logger = logging.getLogger("api_errors")
         error_handler = logging.FileHandler(self.log_dir / "errors.log")
@@ -50,9 +103,9 @@ class ProductionMonitor:
             '%(asctime)s - %(levelname)s - %(pathname)s:%(lineno)d - %(message)s'
         )
         error_handler.setFormatter(error_formatter)
-        self.error_logger.addHandler(error_handler)
+        self._attach_queued_handler(self.error_logger, error_handler)
         self.error_logger.setLevel(logging.ERROR)
-        
+
         # Performance logger
         self.perf_logger = logging.getLogger("performance")
         perf_handler = logging.FileHandler(self.log_dir / "performance.log")
@@ -60,7 +113,7 @@ class ProductionMonitor:
             '%(asctime)s - %(message)s'
         )
         perf_handler.setFormatter(perf_formatter)
-        self.perf_logger.addHandler(perf_handler)
+        self._attach_queued_handler(self.perf_logger, perf_handler)
         self.perf_logger.setLevel(logging.INFO)
     
     def log_request(self, endpoint: str, method: str, status_code: int, 
@@ -72,56 +125,77 @@ class ProductionMonitor:
             self.metrics["requests_success"] += 1
         else:
             self.metrics["requests_error"] += 1
-            self.metrics["error_counts"][status_code] = self.metrics["error_counts"].get(status_code, 0) + 1
-        
-        self.metrics["response_times"].append(response_time)
-        self.metrics["endpoint_usage"][endpoint] = self.metrics["endpoint_usage"].get(endpoint, 0) + 1
+            self.metrics["error_counts"][status_code] += 1
+
+        response_times = self.metrics["response_times"]
+        if len(response_times) == response_times.maxlen:
+            self._rt_sum -= response_times[0]
+        response_times.append(response_time)
+        self._rt_sum += response_time
+        self.metrics["endpoint_usage"][endpoint] += 1
         
-        # Log to file
+        # Log to file — skip the payload build entirely when filtered
+        if not self.api_logger.isEnabledFor(logging.INFO):
+            return
+
         log_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _cached_now(),
             "endpoint": endpoint,
             "method": method,
             "status_code": status_code,
             "response_time_ms": round(response_time * 1000, 2),
             "user_ip": user_ip
         }
-        
-        self.api_logger.info(json.dumps(log_data))
+
+        self.api_logger.info(_JsonMessage(log_data))
     
     def log_error(self, error: Exception, context: Dict[str, Any] = None):
         """Log error with context"""
+        if not self.error_logger.isEnabledFor(logging.ERROR):
+            return
+
         error_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _cached_now(),
             "error_type": type(error).__name__,
             "error_message": str(error),
             "context": context or {}
         }
-        
-        self.error_logger.error(json.dumps(error_data))
+
+        self.error_logger.error(_JsonMessage(error_data))
     
+    def _disk_usage(self):
+        """disk_usage cached for 60s — free space moves far slower than the tick"""
+        cached_at, disk = self._disk_cache
+        now = time.monotonic()
+        if disk is None or now - cached_at >= 60:
+            disk = psutil.disk_usage('/')
+            self._disk_cache = (now, disk)
+        return disk
+
     def log_performance_metrics(self):
         """Log system performance metrics"""
-        cpu_percent = psutil.cpu_percent(interval=1)
+        # interval=None returns instantly using the delta since the last call,
+        # instead of blocking the monitor thread for a full second
+        cpu_percent = psutil.cpu_percent(interval=None)
         memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
-        
+        disk = self._disk_usage()
+
         metrics = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _cached_now(),
             "cpu_percent": cpu_percent,
             "memory_percent": memory.percent,
             "memory_available_gb": round(memory.available / (1024**3), 2),
             "disk_percent": disk.percent,
             "disk_free_gb": round(disk.free / (1024**3), 2)
         }
-        
-        self.perf_logger.info(json.dumps(metrics))
+
+        self.perf_logger.info(_JsonMessage(metrics))
     
     def get_metrics_summary(self) -> Dict[str, Any]:
         """Get current metrics summary"""
         avg_response_time = 0
         if self.metrics["response_times"]:
-            avg_response_time = sum(self.metrics["response_times"]) / len(self.metrics["response_times"])
+            avg_response_time = self._rt_sum / len(self.metrics["response_times"])
         
         return {
             "total_requests": self.metrics["requests_total"],
@@ -173,17 +247,29 @@ def track_endpoint(endpoint_name: str):
 
 class HealthChecker:
     """System health monitoring"""
-    
-    @staticmethod
-    def check_database_connection():
-        """Check database connectivity"""
+
+    # Liveness probes arrive every second; a 5s TTL on the last result keeps
+    # the DB from paying a connection round-trip per probe
+    _db_cache = {"ts": 0.0, "result": None}
+
+    @classmethod
+    def check_database_connection(cls):
+        """Check database connectivity (cached for 5s between real probes)"""
+        cache = cls._db_cache
+        if cache["result"] is not None and time.monotonic() - cache["ts"] < 5:
+            return cache["result"]
+
         try:
             from app.db import engine
             with engine.connect() as conn:
                 conn.execute("SELECT 1")
-            return {"status": "healthy", "message": "Database connection OK"}
+            result = {"status": "healthy", "message": "Database connection OK"}
         except Exception as e:
-            return {"status": "unhealthy", "message": f"Database error: {str(e)}"}
+            result = {"status": "unhealthy", "message": f"Database error: {str(e)}"}
+
+        cache["ts"] = time.monotonic()
+        cache["result"] = result
+        return result
     
     @staticmethod
     def check_disk_space():
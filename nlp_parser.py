@@ -1,110 +1,192 @@
+import functools
 import re
+import threading
 from typing import Dict, List, Optional
 
+# Compiled once at import — parse_prompt runs these per prompt, and compiled
+# patterns dispatch straight to the C matcher without the per-call cache
+# lookup and flag handling of re.search on raw strings
+_DIM_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'(\d+(?:\.\d+)?)\s*[x×]\s*(\d+(?:\.\d+)?)\s*[x×]\s*(\d+(?:\.\d+)?)\s*([a-zA-Z]+)',  # 3D with unit
+    r'(\d+(?:\.\d+)?)\s*[x×]\s*(\d+(?:\.\d+)?)\s*([a-zA-Z]+)',  # 2D with unit
+    r'(\d+(?:\.\d+)?)\s*[x×]\s*(\d+(?:\.\d+)?)\s*[x×]\s*(\d+(?:\.\d+)?)',  # 3D no unit
+    r'(\d+(?:\.\d+)?)\s*[x×]\s*(\d+(?:\.\d+)?)',  # 2D no unit
+    r'(\d+(?:\.\d+)?)\s*(meters?|metres?|m)\s*[x×]\s*(\d+(?:\.\d+)?)\s*(meters?|metres?|m)',  # Verbose
+    r'(\d+(?:\.\d+)?)\s*(cm|centimeters?)\s*[x×]\s*(\d+(?:\.\d+)?)\s*(cm|centimeters?)'  # CM verbose
+))
+
+_PURPOSE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'for\s+([^,.]+)',
+    r'used\s+for\s+([^,.]+)',
+    r'designed\s+for\s+([^,.]+)',
+    r'intended\s+for\s+([^,.]+)',
+    r'purpose\s+is\s+([^,.]+)'
+))
+
+# Keyword tables shared by every parser instance
+_TYPE_EMBEDDINGS = {
+    "building": ["building", "house", "office", "library", "structure", "construction", "architecture", "tower", "skyscraper", "warehouse",
+                "casa", "edificio", "oficina", "maison", "bâtiment", "bureau", "haus", "gebäude", "büro"],
+    "car": ["car", "vehicle", "automobile", "sports car", "racing car", "sedan", "suv", "truck", "van", "coupe",
+           "coche", "auto", "vehículo", "voiture", "automobile", "véhicule", "auto", "fahrzeug", "wagen"],
+    "drone": ["drone", "uav", "aircraft", "flying", "quadcopter", "helicopter", "aerial", "unmanned", "copter",
+             "dron", "avión", "helicóptero", "drone", "avion", "hélicoptère", "drohne", "flugzeug", "hubschrauber"],
+    "table": ["table", "desk", "furniture", "dining table", "coffee table", "workbench", "surface",
+             "mesa", "escritorio", "mueble", "table", "bureau", "meuble", "tisch", "schreibtisch", "möbel"],
+    "gearbox": ["gearbox", "gear", "transmission", "mechanical", "engine part", "drivetrain", "clutch",
+               "caja de cambios", "engranaje", "transmisión", "boîte de vitesses", "engrenage", "transmission", "getriebe", "zahnrad"]
+}
+
+_MATERIAL_PATTERNS = {
+    "steel": ["steel", "metal", "iron", "stainless"],
+    "aluminum": ["aluminum", "aluminium", "alloy", "lightweight metal"],
+    "wood": ["wood", "wooden", "timber", "oak", "pine", "mahogany", "bamboo"],
+    "concrete": ["concrete", "cement", "reinforced concrete"],
+    "glass": ["glass", "transparent", "tempered glass", "laminated"],
+    "carbon fiber": ["carbon fiber", "carbon fibre", "composite", "lightweight"],
+    "plastic": ["plastic", "polymer", "abs", "pvc", "synthetic"],
+    "brick": ["brick", "masonry", "clay brick"],
+    "stone": ["stone", "granite", "marble", "limestone", "rock"]
+}
+
+_CONTEXT_MATERIALS = {
+    "car": ["aluminum", "steel"],
+    "building": ["concrete", "glass"],
+    "drone": ["carbon fiber", "aluminum"],
+    "table": ["wood", "metal"],
+    "gearbox": ["steel", "aluminum"]
+}
+
+_COLOR_TRANSLATIONS = {
+    "red": ["red", "rojo", "rouge", "rot"],
+    "blue": ["blue", "azul", "bleu", "blau"],
+    "green": ["green", "verde", "vert", "grün"],
+    "black": ["black", "negro", "noir", "schwarz"],
+    "white": ["white", "blanco", "blanc", "weiß"],
+    "yellow": ["yellow", "amarillo", "jaune", "gelb"]
+}
+
+class _KeywordScanner:
+    """Finds every known keyword in a text with one linear regex scan
+
+    A lookahead over a longest-first alternation emits the longest keyword
+    starting at each position; shorter keywords hidden behind a longer
+    same-position match are necessarily substrings of it, so a cheap
+    post-expansion over the few matched strings restores exact per-keyword
+    presence — the same answers as one substring test per keyword, without
+    the O(keywords x text) scanning.
+    """
+    __slots__ = ("_keywords", "_pattern")
+
+    def __init__(self, keywords):
+        self._keywords = frozenset(keywords)
+        ordered = sorted(self._keywords, key=len, reverse=True)
+        self._pattern = re.compile("(?=(" + "|".join(map(re.escape, ordered)) + "))")
+
+    def present(self, text):
+        """Return the set of keywords occurring anywhere in text"""
+        found = set(self._pattern.findall(text))
+        if not found:
+            return found
+        return {k for k in self._keywords if any(k in f for f in found)}
+
+_TYPE_SCANNER = _KeywordScanner(kw for kws in _TYPE_EMBEDDINGS.values() for kw in kws)
+
+def _build_keyword_scoring():
+    """Invert the type table: keyword -> [(type, base, exact-match boost)]
+
+    Keywords listed twice under one type keep their doubled weight, and
+    shared keywords (e.g. "table"/"bureau") contribute to every type that
+    lists them — identical tallies to looping the full table.
+    """
+    scoring = {}
+    for obj_type, keywords in _TYPE_EMBEDDINGS.items():
+        for keyword in keywords:
+            entries = scoring.setdefault(keyword, {})
+            base, boost = entries.get(obj_type, (0, 0))
+            entries[obj_type] = (base + len(keyword.split()) * 2, boost + 3)
+    return {
+        kw: tuple((t, base, boost) for t, (base, boost) in entries.items())
+        for kw, entries in scoring.items()
+    }
+
+_KEYWORD_SCORING = _build_keyword_scoring()
+_MATERIAL_SCANNER = _KeywordScanner(p for ps in _MATERIAL_PATTERNS.values() for p in ps)
+
+# All color translations folded into one alternation; the English name comes
+# back as the name of the group that fired, so extraction is a single C-level
+# scan with no per-language Python loop. Deliberately unanchored — inflected
+# forms like "bleue" or "schwarzes" must still match their stem
+_COLOR_RE = re.compile(
+    "|".join(
+        rf"(?P<{eng}>{'|'.join(map(re.escape, words))})"
+        for eng, words in _COLOR_TRANSLATIONS.items()
+    ),
+    re.IGNORECASE,
+)
+
 class AdvancedNLPParser:
     """Unified advanced NLP parser with semantic understanding and multi-language support"""
     
     def __init__(self):
-        self.type_embeddings = {
-            "building": ["building", "house", "office", "library", "structure", "construction", "architecture", "tower", "skyscraper", "warehouse",
-                        "casa", "edificio", "oficina", "maison", "bâtiment", "bureau", "haus", "gebäude", "büro"],
-            "car": ["car", "vehicle", "automobile", "sports car", "racing car", "sedan", "suv", "truck", "van", "coupe",
-                   "coche", "auto", "vehículo", "voiture", "automobile", "véhicule", "auto", "fahrzeug", "wagen"],
-            "drone": ["drone", "uav", "aircraft", "flying", "quadcopter", "helicopter", "aerial", "unmanned", "copter",
-                     "dron", "avión", "helicóptero", "drone", "avion", "hélicoptère", "drohne", "flugzeug", "hubschrauber"],
-            "table": ["table", "desk", "furniture", "dining table", "coffee table", "workbench", "surface",
-                     "mesa", "escritorio", "mueble", "table", "bureau", "meuble", "tisch", "schreibtisch", "möbel"],
-            "gearbox": ["gearbox", "gear", "transmission", "mechanical", "engine part", "drivetrain", "clutch",
-                       "caja de cambios", "engranaje", "transmisión", "boîte de vitesses", "engrenage", "transmission", "getriebe", "zahnrad"]
-        }
-        
+        self.type_embeddings = _TYPE_EMBEDDINGS
+
         self.material_context = {
             "automotive": ["steel", "aluminum", "carbon fiber", "plastic", "rubber", "glass"],
             "construction": ["concrete", "steel", "wood", "glass", "brick", "stone"],
             "aerospace": ["carbon fiber", "aluminum", "titanium", "composite"],
             "furniture": ["wood", "metal", "glass", "plastic", "fabric"]
         }
-        
-        self.color_translations = {
-            "red": ["red", "rojo", "rouge", "rot"],
-            "blue": ["blue", "azul", "bleu", "blau"],
-            "green": ["green", "verde", "vert", "grün"],
-            "black": ["black", "negro", "noir", "schwarz"],
-            "white": ["white", "blanco", "blanc", "weiß"],
-            "yellow": ["yellow", "amarillo", "jaune", "gelb"]
-        }
-    
+
+        self.color_translations = _COLOR_TRANSLATIONS
+
     def extract_type_with_confidence(self, prompt: str) -> Dict[str, float]:
         """Extract object type with confidence scores"""
-        prompt_lower = prompt.lower()
+        return self._type_scores(prompt.lower())
+
+    def _type_scores(self, prompt_lower: str) -> Dict[str, float]:
+        # One linear scan replaces ~80 separate substring searches
+        present = _TYPE_SCANNER.present(prompt_lower)
+        if not present:
+            return {}
+
+        padded = f" {prompt_lower} "
         scores = {}
-        
-        for obj_type, keywords in self.type_embeddings.items():
-            score = 0
-            for keyword in keywords:
-                if keyword in prompt_lower:
-                    # Weight longer keywords higher
-                    score += len(keyword.split()) * 2
-                    # Boost exact matches
-                    if f" {keyword} " in f" {prompt_lower} ":
-                        score += 3
-            
-            if score > 0:
-                scores[obj_type] = score
-        
+
+        # Tally only the keywords that actually occurred — O(found) instead
+        # of walking the whole embedding table per prompt. Longer keywords
+        # weigh more via the precomputed base; exact matches add the boost
+        for keyword in present:
+            exact = f" {keyword} " in padded
+            for obj_type, base, boost in _KEYWORD_SCORING[keyword]:
+                scores[obj_type] = scores.get(obj_type, 0) + base + (boost if exact else 0)
+
         return scores
-    
+
     def extract_materials_contextual(self, prompt: str, obj_type: str) -> List[str]:
         """Extract materials with contextual understanding"""
-        prompt_lower = prompt.lower()
-        materials = []
-        
-        # Material keywords with synonyms
-        material_patterns = {
-            "steel": ["steel", "metal", "iron", "stainless"],
-            "aluminum": ["aluminum", "aluminium", "alloy", "lightweight metal"],
-            "wood": ["wood", "wooden", "timber", "oak", "pine", "mahogany", "bamboo"],
-            "concrete": ["concrete", "cement", "reinforced concrete"],
-            "glass": ["glass", "transparent", "tempered glass", "laminated"],
-            "carbon fiber": ["carbon fiber", "carbon fibre", "composite", "lightweight"],
-            "plastic": ["plastic", "polymer", "abs", "pvc", "synthetic"],
-            "brick": ["brick", "masonry", "clay brick"],
-            "stone": ["stone", "granite", "marble", "limestone", "rock"]
-        }
-        
-        # Extract mentioned materials
-        for material, patterns in material_patterns.items():
-            for pattern in patterns:
-                if pattern in prompt_lower:
-                    materials.append(material)
-                    break
-        
+        return self._materials_from(prompt.lower(), obj_type)
+
+    def _materials_from(self, prompt_lower: str, obj_type: str) -> List[str]:
+        present = _MATERIAL_SCANNER.present(prompt_lower)
+
+        # Extract mentioned materials — one scan, then set lookups per synonym
+        materials = [
+            material
+            for material, patterns in _MATERIAL_PATTERNS.items()
+            if any(pattern in present for pattern in patterns)
+        ]
+
         # Context-based suggestions if no materials found
         if not materials:
-            context_map = {
-                "car": ["aluminum", "steel"],
-                "building": ["concrete", "glass"],
-                "drone": ["carbon fiber", "aluminum"],
-                "table": ["wood", "metal"],
-                "gearbox": ["steel", "aluminum"]
-            }
-            materials = context_map.get(obj_type, ["steel"])
-        
+            materials = _CONTEXT_MATERIALS.get(obj_type, ["steel"])
+
         return list(dict.fromkeys(materials))  # Remove duplicates while preserving order
     
     def extract_dimensions_advanced(self, prompt: str) -> Optional[str]:
         """Advanced dimension extraction with multiple patterns"""
-        patterns = [
-            r'(\d+(?:\.\d+)?)\s*[x×]\s*(\d+(?:\.\d+)?)\s*[x×]\s*(\d+(?:\.\d+)?)\s*([a-zA-Z]+)',  # 3D with unit
-            r'(\d+(?:\.\d+)?)\s*[x×]\s*(\d+(?:\.\d+)?)\s*([a-zA-Z]+)',  # 2D with unit
-            r'(\d+(?:\.\d+)?)\s*[x×]\s*(\d+(?:\.\d+)?)\s*[x×]\s*(\d+(?:\.\d+)?)',  # 3D no unit
-            r'(\d+(?:\.\d+)?)\s*[x×]\s*(\d+(?:\.\d+)?)',  # 2D no unit
-            r'(\d+(?:\.\d+)?)\s*(meters?|metres?|m)\s*[x×]\s*(\d+(?:\.\d+)?)\s*(meters?|metres?|m)',  # Verbose
-            r'(\d+(?:\.\d+)?)\s*(cm|centimeters?)\s*[x×]\s*(\d+(?:\.\d+)?)\s*(cm|centimeters?)'  # CM verbose
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, prompt, re.IGNORECASE)
+        for pattern in _DIM_PATTERNS:
+            match = pattern.search(prompt)
             if match:
                 groups = match.groups()
                 if len(groups) >= 4 and groups[3].isalpha():  # 3D with unit
@@ -123,34 +205,38 @@ class AdvancedNLPParser:
     
     def extract_purpose_semantic(self, prompt: str) -> Optional[str]:
         """Extract purpose with semantic understanding"""
-        purpose_patterns = [
-            r'for\s+([^,.]+)',
-            r'used\s+for\s+([^,.]+)',
-            r'designed\s+for\s+([^,.]+)',
-            r'intended\s+for\s+([^,.]+)',
-            r'purpose\s+is\s+([^,.]+)'
-        ]
-        
-        for pattern in purpose_patterns:
-            match = re.search(pattern, prompt, re.IGNORECASE)
+        for pattern in _PURPOSE_PATTERNS:
+            match = pattern.search(prompt)
             if match:
                 return match.group(1).strip()
-        
+
         return None
     
     def parse_prompt(self, prompt: str) -> Dict:
         """Parse prompt with unified advanced NLP and semantic analysis"""
+        return self._parse_one(prompt, prompt.lower())
+
+    def parse_prompts(self, prompts: List[str]) -> List[Dict]:
+        """Parse many prompts in one call
+
+        Each prompt is lowercased exactly once and shared across the type,
+        material, and color scans; batch callers skip the per-call dispatch
+        of repeated parse_prompt invocations.
+        """
+        return [self._parse_one(prompt, prompt.lower()) for prompt in prompts]
+
+    def _parse_one(self, prompt: str, prompt_lower: str) -> Dict:
         # Enhanced type detection with confidence
-        type_scores = self.extract_type_with_confidence(prompt)
+        type_scores = self._type_scores(prompt_lower)
         obj_type = max(type_scores, key=type_scores.get) if type_scores else "unknown"
         confidence = type_scores.get(obj_type, 0)
-        
+
         # Contextual attribute extraction
-        materials = self.extract_materials_contextual(prompt, obj_type)
+        materials = self._materials_from(prompt_lower, obj_type)
         dimensions = self.extract_dimensions_advanced(prompt)
         purpose = self.extract_purpose_semantic(prompt)
-        color = self._extract_color_multilingual(prompt)
-        
+        color = self._color_from(prompt_lower)
+
         # Advanced semantic validation
         if confidence < 3 and obj_type != "unknown":
             obj_type = "unknown"
@@ -169,11 +255,11 @@ class AdvancedNLPParser:
     
     def _extract_color_multilingual(self, prompt: str) -> Optional[str]:
         """Extract color with multi-language support"""
-        for eng_color, translations in self.color_translations.items():
-            for color_word in translations:
-                if color_word in prompt.lower():
-                    return eng_color
-        return None
+        return self._color_from(prompt.lower())
+
+    def _color_from(self, prompt_lower: str) -> Optional[str]:
+        match = _COLOR_RE.search(prompt_lower)
+        return match.lastgroup if match else None
     
     def _assess_semantic_quality(self, prompt: str, obj_type: str, materials: List[str]) -> float:
         """Assess semantic understanding quality"""
@@ -181,4 +267,31 @@ class AdvancedNLPParser:
         if obj_type != "unknown": quality += 0.3
         if materials and materials != ["unknown"]: quality += 0.2
         if len(prompt.split()) > 3: quality += 0.1  # Detailed prompts
-        return min(1.0, quality)
\ No newline at end of file
+        return min(1.0, quality)
+
+# One parser per process — construction rebuilds every keyword table, so
+# callers should go through get_parser()/parse_prompt_cached instead of
+# instantiating per request
+_PARSER = None
+_PARSER_LOCK = threading.Lock()
+
+def get_parser() -> AdvancedNLPParser:
+    """Shared lazily-built parser instance"""
+    global _PARSER
+    if _PARSER is None:
+        with _PARSER_LOCK:
+            if _PARSER is None:
+                _PARSER = AdvancedNLPParser()
+    return _PARSER
+
+@functools.lru_cache(maxsize=4096)
+def _parse_cached(prompt: str) -> Dict:
+    return get_parser().parse_prompt(prompt)
+
+def parse_prompt_cached(prompt: str) -> Dict:
+    """Parse a prompt, serving repeats from cache — parsing is deterministic
+
+    Returns a shallow copy so callers can edit their spec without
+    corrupting the cached entry.
+    """
+    return dict(_parse_cached(prompt))
\ No newline at end of file
@@ -1,11 +1,14 @@
-import json
 import pathlib
 from datetime import datetime
 
+import orjson
+
 def write_json(report_dir, name, payload):
     """Write JSON report"""
     p = pathlib.Path(report_dir) / f"{name}.json"
-    p.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding='utf-8')
+    # orjson serializes straight to UTF-8 bytes (non-ASCII kept literal, like
+    # ensure_ascii=False), skipping the str build + encode of stdlib json
+    p.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
     return p
 
 def write_txt(report_dir, name, payload):
@@ -1,6 +1,11 @@
+import functools
 import json
 import pathlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+
+import orjson
 from evaluator.criteria import validate_and_score
 from evaluator.feedback import suggest_fixes, apply_fixes, calculate_reward
 from evaluator.llm_feedback import LLMFeedbackAgent
@@ -9,31 +14,78 @@ SAMPLES = pathlib.Path("samples")
 LOGS = pathlib.Path("logs")
 LOGS.mkdir(exist_ok=True, parents=True)
 
+# One agent per process; feedback is deterministic per (spec, score), so
+# repeated iterations over the same spec hit the memo instead of the agent
+_LLM_AGENT = None
+_LLM_AGENT_LOCK = threading.Lock()
+
+def _get_llm_agent():
+    global _LLM_AGENT
+    if _LLM_AGENT is None:
+        with _LLM_AGENT_LOCK:
+            if _LLM_AGENT is None:
+                _LLM_AGENT = LLMFeedbackAgent()
+    return _LLM_AGENT
+
+@functools.lru_cache(maxsize=2048)
+def _cached_feedback(spec_key, spec_score):
+    """Memoized feedback keyed by canonical spec JSON and score"""
+    return _get_llm_agent().generate_comprehensive_feedback(
+        json.loads(spec_key), {"spec_score": spec_score}
+    )
+
+# Runs the feedback pass concurrently with the heuristic fixes; a remote LLM
+# backend makes that call network-bound and highly variable. Sized to match
+# the concurrent per-spec runs in main() so their feedback calls never queue
+# behind each other
+_FEEDBACK_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="feedback")
+
+def load_specs():
+    """Load all sample specs, overlapping file reads across a thread pool"""
+    paths = list(SAMPLES.glob("*.json"))
+    if not paths:
+        return
+
+    # Blocking reads release the GIL, so parse wall time shrinks toward disk
+    # bandwidth; read_bytes + orjson skips the unicode-decode pass entirely
+    with ThreadPoolExecutor(max_workers=min(32, len(paths))) as ex:
+        yield from ex.map(lambda p: (p.stem, orjson.loads(p.read_bytes())), paths)
+
 def run_rl_iterations(spec_name, spec_data, max_iterations=3):
-    """Run RL loop: spec -> evaluate -> feedback -> apply -> re-score"""
-    
+    """Run RL loop: spec -> evaluate -> feedback -> apply -> re-score
+
+    Progress output is buffered and printed in one block at the end so
+    concurrent runs don't interleave their lines.
+    """
+    lines = [f"Running RL on {spec_name}..."]
+
     feedback_log = {
         "spec_name": spec_name,
         "timestamp": datetime.now().isoformat(),
         "iterations": []
     }
     
-    current_spec = dict(spec_data)
-    
+    # apply_fixes is functional (it returns a fresh dict), so the loop never
+    # mutates a spec in place and the log can hold references instead of
+    # defensive copies
+    current_spec = spec_data
+
     for iteration in range(max_iterations):
-        print(f"  Iteration {iteration + 1}:")
+        lines.append(f"  Iteration {iteration + 1}:")
         
         # Evaluate current spec
         evaluation = validate_and_score(current_spec)
         score = evaluation["spec_score"]
         reward = calculate_reward(score)
         
-        print(f"    Score: {score}/10, Reward: {reward}")
+        lines.append(f"    Score: {score}/10, Reward: {reward}")
         
-        # Generate fixes using LLM feedback
-        llm_agent = LLMFeedbackAgent()
-        llm_feedback = llm_agent.generate_comprehensive_feedback(current_spec, evaluation)
+        # Generate fixes using LLM feedback; the heuristic pass runs while the
+        # (possibly remote) feedback call is in flight
+        spec_key = json.dumps(current_spec, sort_keys=True, separators=(",", ":"), default=str)
+        feedback_future = _FEEDBACK_POOL.submit(_cached_feedback, spec_key, score)
         fixes = suggest_fixes(current_spec, evaluation)
+        llm_feedback = feedback_future.result()
         
         # Add LLM suggestions to fixes
         llm_suggestions = llm_feedback.get('improvement_suggestions', [])
@@ -42,7 +94,7 @@ def run_rl_iterations(spec_name, spec_data, max_iterations=3):
         # Log iteration
         iteration_log = {
             "iteration": iteration + 1,
-            "before_spec": dict(current_spec),
+            "before_spec": current_spec,
             "score_before": score,
             "reward": reward,
             "fixes_suggested": fixes,
@@ -54,56 +106,58 @@ def run_rl_iterations(spec_name, spec_data, max_iterations=3):
         # Apply fixes if any
         if fixes:
             improved_spec = apply_fixes(current_spec, fixes)
-            improved_evaluation = validate_and_score(improved_spec)
-            improved_score = improved_evaluation["spec_score"]
-            
+
+            # Fixes only fill missing fields; when none applied, the spec is
+            # unchanged and the previous evaluation still holds
+            if improved_spec == current_spec:
+                improved_score = score
+            else:
+                improved_evaluation = validate_and_score(improved_spec)
+                improved_score = improved_evaluation["spec_score"]
+
             iteration_log["after_spec"] = improved_spec
             iteration_log["score_after"] = improved_score
             iteration_log["improvement"] = improved_score > score
             
-            print(f"    Fixes applied: {len(fixes)}")
-            print(f"    New score: {improved_score}/10")
+            lines.append(f"    Fixes applied: {len(fixes)}")
+            lines.append(f"    New score: {improved_score}/10")
             
             # Update current spec for next iteration
             current_spec = improved_spec
         else:
-            print(f"    No fixes needed")
-            iteration_log["after_spec"] = dict(current_spec)
+            lines.append(f"    No fixes needed")
+            iteration_log["after_spec"] = current_spec
             iteration_log["score_after"] = score
         
         feedback_log["iterations"].append(iteration_log)
         
         # Stop if perfect score achieved
         if score >= 10:
-            print(f"    Perfect score achieved!")
+            lines.append(f"    Perfect score achieved!")
             break
-    
+
+    print("\n".join(lines) + "\n")
     return feedback_log
 
 def main():
     """Run RL iterations on sample specs"""
     
     # Load specs
-    specs = {}
-    for p in SAMPLES.glob("*.json"):
-        specs[p.stem] = json.loads(p.read_text(encoding='utf-8'))
-    
-    all_feedback_logs = []
-    
-    # Run RL on first 3 specs
-    for i, (name, spec) in enumerate(list(specs.items())[:3]):
-        print(f"Running RL on {name}...")
-        
-        feedback_log = run_rl_iterations(name, spec)
-        all_feedback_logs.append(feedback_log)
-        
-        print()
-    
-    # Save all feedback logs
+    specs = dict(load_specs())
+
+    # Run RL on first 3 specs. Each run is independent and its critical path
+    # is LLM round-trips, so the runs overlap on a thread pool; collecting
+    # the futures in submit order keeps the logs deterministic
+    selected = list(specs.items())[:3]
+    with ThreadPoolExecutor(max_workers=min(len(selected), 8) or 1) as ex:
+        futures = [ex.submit(run_rl_iterations, name, spec) for name, spec in selected]
+        all_feedback_logs = [future.result() for future in futures]
+
+    # Save all feedback logs — orjson emits the indented UTF-8 bytes directly,
+    # skipping the stdlib pretty-printer on what can be a multi-MB list
     feedback_file = LOGS / "feedback_log.json"
-    with open(feedback_file, "w", encoding='utf-8') as f:
-        json.dump(all_feedback_logs, f, indent=2, ensure_ascii=False)
-    
+    feedback_file.write_bytes(orjson.dumps(all_feedback_logs, option=orjson.OPT_INDENT_2))
+
     print(f"Feedback logs saved to {feedback_file}")
     
     # Summary
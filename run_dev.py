@@ -0,0 +1,9 @@
+#!/usr/bin/env python3
+"""
+Development server entry point with auto-reload (single worker)
+"""
+
+import uvicorn
+
+if __name__ == "__main__":
+    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
@@ -1,8 +1,31 @@
-from fastapi import FastAPI
+import re
+from functools import lru_cache
+
+import orjson
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import Dict, Any, Optional
 
-app = FastAPI(title="Prompt to JSON Agent API", version="1.0.0")
+# orjson serializes straight to bytes, skipping stdlib json + UTF-8 encode
+app = FastAPI(title="Prompt to JSON Agent API", version="1.0.0", default_response_class=ORJSONResponse)
+
+# One compiled scan each for type and color instead of a chain of substring
+# tests per request; the table replaces the if/elif ladder
+_TYPE_RE = re.compile(r"car|building|drone")
+_COLOR_RE = re.compile(r"red|blue|green|black|white")
+
+# Field weights for /evaluate: one pass over a constant tuple instead of a
+# branch per field, and new fields are a tuple entry away
+_SCORE_WEIGHTS = (("type", 1), ("material", 1), ("dimensions", 2), ("color", 1))
+
+# type -> (materials, dimensions); tuples serialize to the same JSON arrays
+_TYPE_TABLE = {
+    "car": (("steel", "aluminum"), "4.5x1.8x1.4m"),
+    "building": (("concrete", "glass"), "20x15x8m"),
+    "drone": (("carbon fiber",), "50x50x15cm"),
+    "object": (("steel",), "100x50x30cm"),
+}
 
 class PromptRequest(BaseModel):
     prompt: str
@@ -22,39 +45,31 @@ class ValuesRequest(BaseModel):
     discipline: Optional[str] = None
     gratitude: Optional[str] = None
 
+# Constant bodies serialized once at import; these endpoints get polled
+# constantly, and a prebuilt Response reduces each hit to a socket write
+_HEALTH_JSON = orjson.dumps({"status": "ok", "service": "prompt-to-json-agent"})
+_METRICS_JSON = orjson.dumps({"total_requests": 0, "success_rate": 100, "avg_response_time": 0.1})
+
 @app.get("/health")
-def health():
-    return {"status": "ok", "service": "prompt-to-json-agent"}
+async def health():
+    return Response(content=_HEALTH_JSON, media_type="application/json")
+
+# Parsing is pure with ~24 distinct outcomes, so repeated prompts resolve to
+# one dict lookup; the tuple result keeps the cache free of mutable state
+@lru_cache(maxsize=4096)
+def _parse(prompt: str):
+    type_match = _TYPE_RE.search(prompt)
+    obj_type = type_match.group(0) if type_match else "object"
+    materials, dimensions = _TYPE_TABLE[obj_type]
+
+    color_match = _COLOR_RE.search(prompt)
+    color = color_match.group(0) if color_match else None
+    return obj_type, materials, dimensions, color
 
 @app.post("/generate")
-def generate(request: PromptRequest):
-    prompt = request.prompt.lower()
-    
-    # Simple prompt parsing
-    if "car" in prompt:
-        obj_type = "car"
-        materials = ["steel", "aluminum"]
-        dimensions = "4.5x1.8x1.4m"
-    elif "building" in prompt:
-        obj_type = "building" 
-        materials = ["concrete", "glass"]
-        dimensions = "20x15x8m"
-    elif "drone" in prompt:
-        obj_type = "drone"
-        materials = ["carbon fiber"]
-        dimensions = "50x50x15cm"
-    else:
-        obj_type = "object"
-        materials = ["steel"]
-        dimensions = "100x50x30cm"
-    
-    # Extract color
-    color = None
-    for c in ["red", "blue", "green", "black", "white"]:
-        if c in prompt:
-            color = c
-            break
-    
+async def generate(request: PromptRequest):
+    obj_type, materials, dimensions, color = _parse(request.prompt.lower())
+
     return {
         "type": obj_type,
         "material": materials,
@@ -65,33 +80,29 @@ def generate(request: PromptRequest):
     }
 
 @app.post("/evaluate")
-def evaluate(request: SpecRequest):
-    # Simple evaluation
+async def evaluate(request: SpecRequest):
+    # Simple evaluation: base 5 plus the weight of each filled field
     spec = request.spec
-    score = 5  # Base score
-    
-    if spec.get("type"):
-        score += 1
-    if spec.get("material"):
-        score += 1
-    if spec.get("dimensions"):
-        score += 2
-    if spec.get("color"):
-        score += 1
-    
+    score = 5 + sum(weight for field, weight in _SCORE_WEIGHTS if spec.get(field))
+
     return {"score": min(score, 10), "report_id": "mock-report-id"}
 
 @app.post("/iterate")
-def iterate(request: IterateRequest):
+async def iterate(request: IterateRequest):
     spec = request.spec or {}
-    
-    # Simple improvement
-    improved_spec = spec.copy()
-    if not improved_spec.get("color"):
-        improved_spec["color"] = "gray"
-    if not improved_spec.get("purpose"):
-        improved_spec["purpose"] = "general use"
-    
+
+    # Simple improvement; a spec with both fields already set needs no
+    # changes, so skip the copy and return it as-is
+    if spec.get("color") and spec.get("purpose"):
+        improved_spec = spec
+    else:
+        improved_spec = spec.copy()
+        if not improved_spec.get("color"):
+            improved_spec["color"] = "gray"
+        if not improved_spec.get("purpose"):
+            improved_spec["purpose"] = "general use"
+
+
     return {
         "iterations": 1,
         "history": [{
@@ -105,7 +116,7 @@ def iterate(request: IterateRequest):
     }
 
 @app.get("/reports/{report_id}")
-def get_report(report_id: str):
+async def get_report(report_id: str):
     return {
         "id": report_id,
         "evaluation": {"mock": "data"},
@@ -114,16 +125,12 @@ def get_report(report_id: str):
     }
 
 @app.post("/log-values")
-def log_values(request: ValuesRequest):
+async def log_values(request: ValuesRequest):
     return {"id": "mock-values-id", "message": "Values logged successfully"}
 
 @app.get("/metrics")
-def get_metrics():
-    return {
-        "total_requests": 0,
-        "success_rate": 100,
-        "avg_response_time": 0.1
-    }
+async def get_metrics():
+    return Response(content=_METRICS_JSON, media_type="application/json")
 
 if __name__ == "__main__":
     import uvicorn
@@ -6,7 +6,6 @@ Handles environment validation, database setup, and server startup
 
 import os
 import sys
-import subprocess
 import time
 from pathlib import Path
 from config import get_settings, validate_environment, get_config_summary
@@ -59,51 +58,69 @@ def check_environment():
 def start_server():
     """Start the production server"""
     settings = get_settings()
-    
-    cmd = [
-        "uvicorn",
-        "app.main:app",
-        "--host", settings.api_host,
-        "--port", str(settings.api_port),
-        "--workers", str(settings.api_workers),
-        "--log-level", settings.log_level.lower()
-    ]
-    
-    if settings.api_reload:
-        cmd.append("--reload")
-    
-    print(f"🚀 Starting server: {' '.join(cmd)}")
-    
+
+    # Fall back to the gunicorn formula when the worker count is unset or
+    # zero, so a missing config value never serializes the whole app behind
+    # one process
+    workers = settings.api_workers or (2 * os.cpu_count() + 1)
+
+    # Reload forces a single worker, so it additionally requires an explicit
+    # DEBUG env var — a stray config flag can't put prod in reload mode
+    reload = bool(settings.api_reload and os.getenv("DEBUG"))
+
+    print(f"🚀 Starting server: app.main:app on {settings.api_host}:{settings.api_port} ({workers} workers)")
+
     try:
-        subprocess.run(cmd, check=True)
+        # In-process launch instead of a subprocess: the engine, parser
+        # tables, and other import-time state warmed by the startup checks
+        # stay live in this interpreter, and workers inherit them on fork.
+        # loop/http pick the C-accelerated uvloop and httptools, which ship
+        # with the uvicorn[standard] pin
+        import uvicorn
+
+        uvicorn.run(
+            "app.main:app",
+            host=settings.api_host,
+            port=settings.api_port,
+            workers=workers,
+            log_level=settings.log_level.lower(),
+            loop="uvloop",
+            http="httptools",
+            reload=reload,
+        )
     except KeyboardInterrupt:
         print("\n👋 Server stopped by user")
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Server failed to start: {e}")
-        sys.exit(1)
 
 def health_check():
-    """Perform startup health check"""
+    """Perform startup health check
+
+    Exponential backoff from 50ms instead of fixed 2s sleeps, so a server
+    that's up in milliseconds is confirmed in milliseconds; one keep-alive
+    session reuses the TCP connection across attempts.
+    """
     import requests
     import time
-    
+
     settings = get_settings()
     url = f"http://{settings.api_host}:{settings.api_port}/health"
-    
+
     print("🔍 Performing health check...")
-    
-    for attempt in range(5):
+
+    session = requests.Session()
+    delay = 0.05
+    for attempt in range(8):
         try:
-            response = requests.get(url, timeout=5)
+            response = session.get(url, timeout=1)
             if response.status_code == 200:
                 print("✅ Health check passed")
                 return True
         except requests.exceptions.RequestException:
             pass
-        
-        print(f"⏳ Health check attempt {attempt + 1}/5...")
-        time.sleep(2)
-    
+
+        print(f"⏳ Health check attempt {attempt + 1}/8...")
+        time.sleep(delay)
+        delay *= 2
+
     print("❌ Health check failed")
     return False
 
@@ -9,12 +9,18 @@ from agents.feedback import FeedbackAgent
 from agents.rl_agent import RLAgent
 
 class TestAgents:
-    def setup_method(self):
-        """Setup test fixtures"""
-        self.prompt_agent = PromptAgent()
-        self.evaluator = Evaluator()
-        self.feedback_agent = FeedbackAgent()
-        self.rl_agent = RLAgent(self.evaluator, self.feedback_agent)
+    @classmethod
+    def setup_class(cls):
+        """Setup shared test fixtures
+
+        Built once per class instead of per test — the agents are stateless
+        across these tests, so re-running the constructors eight times only
+        burned wall time.
+        """
+        cls.prompt_agent = PromptAgent()
+        cls.evaluator = Evaluator()
+        cls.feedback_agent = FeedbackAgent()
+        cls.rl_agent = RLAgent(cls.evaluator, cls.feedback_agent)
     
     def test_prompt_agent_run(self):
         """Test prompt agent run method"""
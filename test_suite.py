@@ -4,40 +4,91 @@ Comprehensive test suite for prompt-to-json-agent backend
 Tests API endpoints, database operations, and edge cases
 """
 
+import orjson
 import requests
-import json
+import threading
 import time
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+
+# Request bodies serialized once at import; data= skips the per-call
+# json.dumps that requests runs for every json= payload
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_GEN_BODY = orjson.dumps({"prompt": "design a red sports car"})
+_EMPTY_GEN_BODY = orjson.dumps({"prompt": ""})
+_UNICODE_GEN_BODY = orjson.dumps({"prompt": "Diseña un coche deportivo rojo 🚗"})
+_EVAL_BODY = orjson.dumps({
+    "prompt": "test car",
+    "spec": {
+        "type": "car",
+        "material": ["steel", "aluminum"],
+        "dimensions": "4.5x1.8x1.4m",
+        "color": "red",
+        "purpose": "transportation",
+        "extras": None
+    }
+})
+_INVALID_EVAL_BODY = orjson.dumps({"prompt": "test", "spec": {"invalid": "spec"}})
+_ITER_BODY = orjson.dumps({
+    "spec": {
+        "type": "car",
+        "material": ["unknown"],
+        "dimensions": None,
+        "color": None,
+        "purpose": None,
+        "extras": None
+    },
+    "max_iters": 2
+})
+_VALUES_BODY = orjson.dumps({
+    "honesty": "Always truthful in responses",
+    "integrity": "Consistent ethical behavior",
+    "discipline": "Systematic approach to tasks",
+    "gratitude": "Appreciation for user feedback"
+})
 
 class APITester:
     def __init__(self, base_url="http://localhost:8000"):
         self.base_url = base_url
         self.passed = 0
         self.failed = 0
-        
+        self._lock = threading.Lock()
+
+        # One keep-alive session for the whole suite: the TCP (and TLS)
+        # handshake is paid once per pooled connection instead of per request
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
     def test(self, name, func):
-        """Run a test and track results"""
+        """Run a test and track results
+
+        Prints one block per test so concurrent tests don't interleave, and
+        guards the counters since tests run from pool threads.
+        """
         try:
-            print(f"🧪 Testing: {name}")
             func()
-            print(f"✅ PASSED: {name}")
-            self.passed += 1
+            print(f"🧪 Testing: {name}\n✅ PASSED: {name}")
+            with self._lock:
+                self.passed += 1
         except Exception as e:
-            print(f"❌ FAILED: {name} - {str(e)}")
-            self.failed += 1
+            print(f"🧪 Testing: {name}\n❌ FAILED: {name} - {str(e)}")
+            with self._lock:
+                self.failed += 1
     
     def test_health_endpoint(self):
         """Test health check endpoint"""
-        response = requests.get(f"{self.base_url}/health")
+        response = self.session.get(f"{self.base_url}/health")
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "ok"
     
     def test_generate_endpoint(self):
         """Test generate endpoint"""
-        payload = {"prompt": "design a red sports car"}
-        response = requests.post(f"{self.base_url}/generate", json=payload)
+        response = self.session.post(f"{self.base_url}/generate", data=_GEN_BODY, headers=_JSON_HEADERS)
         assert response.status_code == 200
         data = response.json()
         assert "type" in data
@@ -45,18 +96,7 @@ class APITester:
     
     def test_evaluate_endpoint(self):
         """Test evaluate endpoint"""
-        payload = {
-            "prompt": "test car",
-            "spec": {
-                "type": "car",
-                "material": ["steel", "aluminum"],
-                "dimensions": "4.5x1.8x1.4m",
-                "color": "red",
-                "purpose": "transportation",
-                "extras": None
-            }
-        }
-        response = requests.post(f"{self.base_url}/evaluate", json=payload)
+        response = self.session.post(f"{self.base_url}/evaluate", data=_EVAL_BODY, headers=_JSON_HEADERS)
         assert response.status_code == 200
         data = response.json()
         assert "report_id" in data
@@ -65,18 +105,7 @@ class APITester:
     
     def test_iterate_endpoint(self):
         """Test iterate endpoint"""
-        payload = {
-            "spec": {
-                "type": "car",
-                "material": ["unknown"],
-                "dimensions": None,
-                "color": None,
-                "purpose": None,
-                "extras": None
-            },
-            "max_iters": 2
-        }
-        response = requests.post(f"{self.base_url}/iterate", json=payload)
+        response = self.session.post(f"{self.base_url}/iterate", data=_ITER_BODY, headers=_JSON_HEADERS)
         assert response.status_code == 200
         data = response.json()
         assert "iterations" in data
@@ -89,7 +118,7 @@ class APITester:
         report_id = self.test_evaluate_endpoint()
         
         # Then retrieve it
-        response = requests.get(f"{self.base_url}/reports/{report_id}")
+        response = self.session.get(f"{self.base_url}/reports/{report_id}")
         assert response.status_code == 200
         data = response.json()
         assert "id" in data
@@ -97,13 +126,7 @@ class APITester:
     
     def test_log_values_endpoint(self):
         """Test HIDG values logging endpoint"""
-        payload = {
-            "honesty": "Always truthful in responses",
-            "integrity": "Consistent ethical behavior",
-            "discipline": "Systematic approach to tasks",
-            "gratitude": "Appreciation for user feedback"
-        }
-        response = requests.post(f"{self.base_url}/log-values", json=payload)
+        response = self.session.post(f"{self.base_url}/log-values", data=_VALUES_BODY, headers=_JSON_HEADERS)
         assert response.status_code == 200
         data = response.json()
         assert "id" in data
@@ -112,25 +135,22 @@ class APITester:
     def test_edge_cases(self):
         """Test edge cases and error handling"""
         # Empty prompt
-        response = requests.post(f"{self.base_url}/generate", json={"prompt": ""})
+        response = self.session.post(f"{self.base_url}/generate", data=_EMPTY_GEN_BODY, headers=_JSON_HEADERS)
         assert response.status_code == 200  # Should handle gracefully
         
         # Invalid spec
-        response = requests.post(f"{self.base_url}/evaluate", json={
-            "prompt": "test",
-            "spec": {"invalid": "spec"}
-        })
+        response = self.session.post(f"{self.base_url}/evaluate", data=_INVALID_EVAL_BODY, headers=_JSON_HEADERS)
         assert response.status_code == 200  # Should handle gracefully
         
         # Non-existent report
-        response = requests.get(f"{self.base_url}/reports/00000000-0000-0000-0000-000000000000")
+        response = self.session.get(f"{self.base_url}/reports/00000000-0000-0000-0000-000000000000")
         assert response.status_code == 404
     
     def test_rate_limiting(self):
         """Test rate limiting functionality"""
         # Make multiple rapid requests
         for i in range(3):
-            response = requests.get(f"{self.base_url}/health")
+            response = self.session.get(f"{self.base_url}/health")
             assert response.status_code == 200
         
         # Should still work within limits
@@ -138,8 +158,7 @@ class APITester:
     
     def test_unicode_support(self):
         """Test Unicode and international character support"""
-        payload = {"prompt": "Diseña un coche deportivo rojo 🚗"}
-        response = requests.post(f"{self.base_url}/generate", json=payload)
+        response = self.session.post(f"{self.base_url}/generate", data=_UNICODE_GEN_BODY, headers=_JSON_HEADERS)
         assert response.status_code == 200
         data = response.json()
         assert "type" in data
@@ -151,22 +170,28 @@ class APITester:
         
         # Check if API is running
         try:
-            requests.get(f"{self.base_url}/health", timeout=5)
+            self.session.get(f"{self.base_url}/health", timeout=5)
         except requests.exceptions.RequestException:
             print(f"❌ API not accessible at {self.base_url}")
             print("💡 Start the API with: uvicorn app.main:app --reload --host 0.0.0.0 --port 8000")
             return False
         
-        # Run all tests
-        self.test("Health Endpoint", self.test_health_endpoint)
-        self.test("Generate Endpoint", self.test_generate_endpoint)
-        self.test("Evaluate Endpoint", self.test_evaluate_endpoint)
-        self.test("Iterate Endpoint", self.test_iterate_endpoint)
-        self.test("Reports Endpoint", self.test_reports_endpoint)
-        self.test("Log Values Endpoint", self.test_log_values_endpoint)
-        self.test("Edge Cases", self.test_edge_cases)
-        self.test("Rate Limiting", self.test_rate_limiting)
-        self.test("Unicode Support", self.test_unicode_support)
+        # Run all tests; they hit independent endpoints, so overlap them on
+        # a pool and let the shared session multiplex the connections
+        tests = [
+            ("Health Endpoint", self.test_health_endpoint),
+            ("Generate Endpoint", self.test_generate_endpoint),
+            ("Evaluate Endpoint", self.test_evaluate_endpoint),
+            ("Iterate Endpoint", self.test_iterate_endpoint),
+            ("Reports Endpoint", self.test_reports_endpoint),
+            ("Log Values Endpoint", self.test_log_values_endpoint),
+            ("Edge Cases", self.test_edge_cases),
+            ("Rate Limiting", self.test_rate_limiting),
+            ("Unicode Support", self.test_unicode_support),
+        ]
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            for name, func in tests:
+                ex.submit(self.test, name, func)
         
         # Print results
         print("\n" + "=" * 50)
@@ -184,60 +209,67 @@ class LoadTester:
         self.base_url = base_url
     
     def run_load_test(self, concurrent_users=10, requests_per_user=5):
-        """Run basic load test"""
+        """Run basic load test
+
+        Users are coroutines on one event loop sharing a keep-alive
+        connection pool, so measured throughput reflects the server rather
+        than thread scheduling overhead in the tester.
+        """
         print(f"🔥 Load Testing: {concurrent_users} users, {requests_per_user} requests each")
-        
-        import threading
-        import time
-        
-        results = []
-        
-        def user_simulation():
-            user_results = []
+
+        import array
+        import asyncio
+        import httpx
+        import numpy as np
+
+        # Results land in flat preallocated buffers written by index — no
+        # dict per request on the hot path, and the analysis below runs as
+        # numpy reductions over contiguous memory. Errors record status -1
+        # and leave the latency slot at 0
+        total = concurrent_users * requests_per_user
+        statuses = array.array("i", bytes(4 * total))
+        latencies = array.array("d", bytes(8 * total))
+
+        async def user_simulation(client, offset):
             for i in range(requests_per_user):
-                start_time = time.time()
+                idx = offset + i
+                t0 = time.perf_counter()
                 try:
-                    response = requests.get(f"{self.base_url}/health", timeout=10)
-                    end_time = time.time()
-                    user_results.append({
-                        "status": response.status_code,
-                        "time": end_time - start_time
-                    })
-                except Exception as e:
-                    user_results.append({
-                        "status": "error",
-                        "time": None,
-                        "error": str(e)
-                    })
-            results.extend(user_results)
-        
-        # Start concurrent users
-        threads = []
+                    response = await client.get(f"{self.base_url}/health", timeout=10)
+                    statuses[idx] = response.status_code
+                    latencies[idx] = time.perf_counter() - t0
+                except Exception:
+                    statuses[idx] = -1
+
+        async def run_users():
+            limits = httpx.Limits(
+                max_connections=concurrent_users * 2,
+                max_keepalive_connections=concurrent_users,
+            )
+            async with httpx.AsyncClient(limits=limits) as client:
+                await asyncio.gather(*(
+                    user_simulation(client, user * requests_per_user)
+                    for user in range(concurrent_users)
+                ))
+
         start_time = time.time()
-        
-        for i in range(concurrent_users):
-            thread = threading.Thread(target=user_simulation)
-            threads.append(thread)
-            thread.start()
-        
-        # Wait for all threads
-        for thread in threads:
-            thread.join()
-        
+        asyncio.run(run_users())
         end_time = time.time()
-        
+
         # Analyze results
-        successful = len([r for r in results if r["status"] == 200])
-        failed = len([r for r in results if r["status"] != 200])
-        avg_time = sum([r["time"] for r in results if r["time"]]) / len([r for r in results if r["time"]])
-        
+        status_arr = np.frombuffer(statuses, dtype=np.int32)
+        latency_arr = np.frombuffer(latencies, dtype=np.float64)
+        successful = int((status_arr == 200).sum())
+        timed = latency_arr[latency_arr > 0]
+        avg_time = float(timed.mean()) if timed.size else 0.0
+
         print(f"📈 Load Test Results:")
-        print(f"   Total Requests: {len(results)}")
+        print(f"   Total Requests: {total}")
         print(f"   Successful: {successful}")
-        print(f"   Failed: {failed}")
+        print(f"   Failed: {total - successful}")
         print(f"   Average Response Time: {avg_time:.3f}s")
         print(f"   Total Time: {end_time - start_time:.3f}s")
-        print(f"   Requests/Second: {len(results) / (end_time - start_time):.2f}")
+        print(f"   Requests/Second: {total / (end_time - start_time):.2f}")
 
 def main():
     """Main test runner"""